@@ -1,6 +1,7 @@
 # path: ./app.py
 
 from flask import Flask, render_template, request
+from jinja2 import FileSystemBytecodeCache
 from global_state import training_manager, app_logger # Import global instances
 from gui import DEFAULT_HYPERPARAMETERS, DEFAULT_TRAINING_CONFIG
 from routes.training_routes import create_training_blueprint
@@ -17,10 +18,15 @@ from db_manager import DBManager
 app = Flask(__name__)
 logger = app_logger  # Use the global logger
 
+# Templates ship with the app: skip per-request reload checks and reuse compiled bytecode
+app.config["TEMPLATES_AUTO_RELOAD"] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
 @app.before_request
 def suppress_logging():
     """Suppress logs for specific routes."""
-    if request.path == "/training/render_status":
+    if request.path in ("/training/render_status", "/training/status"):
         log = logging.getLogger("werkzeug")
         log.setLevel(logging.ERROR)
 
@@ -31,6 +37,9 @@ app.register_blueprint(create_tensorboard_blueprint(training_manager, app_logger
 app.register_blueprint(create_stream_blueprint(training_manager, app_logger), url_prefix="/stream")
 app.register_blueprint(create_dashboard_blueprint(training_manager, app_logger, DBManager))  # No prefix for the dashboard
 
+# Compile the landing page before the first request
+app.jinja_env.get_template("index.html")
+
 @app.route("/", methods=["GET"])
 def index():
     """
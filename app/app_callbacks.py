@@ -50,12 +50,14 @@ class AutoSave(BaseCallback):
 
 class RenderCallback(BaseCallback):
     """
-    A callback to signal the TrainingManager when the model should be updated.
+    A callback to signal the TrainingManager when the model should be updated,
+    and to tick the render loop as training steps.
     """
 
-    def __init__(self, training_manager, verbose=0):
+    def __init__(self, training_manager, tick_every=1, verbose=0):
         super(RenderCallback, self).__init__(verbose)
         self.training_manager = training_manager
+        self.tick_every = max(1, int(tick_every))
         self.logger = LogManager("RenderCallback")
 
     def _on_rollout_start(self):
@@ -64,8 +66,10 @@ class RenderCallback(BaseCallback):
         self.logger.info("Signaled TrainingManager to update cached policy.")
 
     def _on_step(self) -> bool:
-        """Override _on_step since it is abstract in BaseCallback."""
-        return True  # No specific logic required here.
+        """Tick the render loop every `tick_every` training steps."""
+        if self.n_calls % self.tick_every == 0:
+            self.training_manager.frame_tick.set()
+        return True
 
 
 # Define the AutoSave blueprint with argument mapping
@@ -2,11 +2,15 @@
 
 from icecream import ic
 from multiprocessing import Queue
+from collections import deque
+import atexit
+import threading
+import time
 import colorama
 from colorama import Fore, Style
-import inspect
 import os
-import traceback
+import queue
+import sys
 from concurrent_log_handler import ConcurrentRotatingFileHandler
 import logging
 from datetime import datetime
@@ -16,8 +20,9 @@ from colorsys import hsv_to_rgb
 
 colorama.init(autoreset=True)
 
-# Shared queue for UI logging
-log_queue = Queue()
+# Shared queue for UI logging, bounded so it cannot grow while no dashboard is listening
+LOG_QUEUE_MAXSIZE = 1000
+log_queue = Queue(maxsize=LOG_QUEUE_MAXSIZE)
 
 # Mario's palette as starting RGB tuples
 MARIO_PALETTE_RGB = [
@@ -126,7 +131,94 @@ def send_to_ui_log(message):
     Send clean logs to the shared queue for the UI.
     """
     clean_message = strip_ansi_escape_sequences(message)
-    log_queue.put(clean_message)
+    try:
+        log_queue.put_nowait(clean_message)
+    except queue.Full:
+        # Drop the oldest entry to make room for the newest
+        try:
+            log_queue.get_nowait()
+            log_queue.put_nowait(clean_message)
+        except (queue.Empty, queue.Full):
+            pass
+
+class BufferedTerminalWriter:
+    """
+    Coalesces terminal log lines and writes them in batches from a daemon thread,
+    so a burst of records costs one write and one flush instead of one per record.
+    """
+
+    def __init__(self, flush_interval=0.01):
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pid = None
+        self._lines = deque()
+        self._pending = threading.Event()
+
+    def write(self, line):
+        """Queue a line (including its trailing newline) for the next batch."""
+        if self._pid != os.getpid():
+            self._start()
+        self._lines.append(line)
+        self._pending.set()
+
+    def flush(self):
+        """Write every queued line to stdout in a single call."""
+        # The flusher thread and the atexit hook can both get here; one drains at a time
+        with self._flush_lock:
+            lines = []
+            while self._lines:
+                lines.append(self._lines.popleft())
+            if lines:
+                sys.stdout.write("".join(lines))
+                sys.stdout.flush()
+
+    def _start(self):
+        """Start the flusher thread; forked processes get their own."""
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._lines = deque()
+            self._pending = threading.Event()
+            # A fork may have copied the lock while the parent's flusher held it
+            self._flush_lock = threading.Lock()
+            threading.Thread(target=self._run, name="log-terminal-writer", daemon=True).start()
+            self._pid = os.getpid()
+
+    def _run(self):
+        pending = self._pending
+        while True:
+            pending.wait()
+            time.sleep(self.flush_interval)  # Let the rest of a burst accumulate
+            pending.clear()
+            self.flush()
+
+
+# Message body plus any exception traceback; logging caches the traceback text on the record
+message_formatter = logging.Formatter("%(message)s")
+
+terminal_writer = BufferedTerminalWriter()
+atexit.register(terminal_writer.flush)
+
+# Logger names derived from caller source files, keyed by code filename
+_module_names = {}
+
+
+def caller_module_name(depth=2):
+    """
+    Return the module name of the caller `depth` frames above this function.
+
+    :param depth: Number of frames to walk up from this function.
+    :return: Source file name without the `.py` suffix.
+    """
+    try:
+        filename = sys._getframe(depth).f_code.co_filename
+    except ValueError:
+        return "unknown"
+    name = _module_names.get(filename)
+    if name is None:
+        name = _module_names[filename] = os.path.basename(filename).replace(".py", "")
+    return name
 
 def configure_ic_logger(name, color):
     """
@@ -148,8 +240,7 @@ class LogManager:
 
     def __new__(cls, name=None):
         if name is None:
-            frame = inspect.currentframe().f_back
-            name = os.path.basename(frame.f_code.co_filename).replace(".py", "")
+            name = caller_module_name()
         if name not in cls._instances:
             instance = super(LogManager, cls).__new__(cls)
             cls._instances[name] = instance
@@ -161,8 +252,7 @@ class LogManager:
         self.initialized = True
 
         if name is None:
-            frame = inspect.currentframe().f_back
-            name = os.path.basename(frame.f_code.co_filename).replace(".py", "")
+            name = caller_module_name()
         self.name = name
 
         # Set up logger
@@ -176,6 +266,18 @@ class LogManager:
 
         self.logger.debug(f"Logger initialized for {self.name}")
 
+    @classmethod
+    def for_name(cls, name):
+        """
+        Return the scoped logger for `name`, creating it on first use.
+        Mirrors logging.getLogger: repeated lookups return the same instance.
+
+        :param name: Logger name.
+        :return: LogManager instance for that name.
+        """
+        instance = cls._instances.get(name)
+        return instance if instance is not None else cls(name)
+
     def _setup_handlers(self):
         """
         Set up handlers for file, terminal, and UI logs.
@@ -212,7 +314,7 @@ class LogManager:
         Process logs for UI display.
         """
         # Extract clean message
-        message = strip_ansi_escape_sequences(record.getMessage())
+        message = strip_ansi_escape_sequences(message_formatter.format(record))
         # Strip logger name, timestamps, and levels
         clean_message = re.sub(r"\[.*?\] ", "", message, count=1)
         send_to_ui_log(clean_message)
@@ -223,8 +325,8 @@ class LogManager:
         """
         # Add color dynamically for terminal
         level_color = self._get_level_color(record.levelname)
-        formatted_message = f"{self.color}[{self.name}] {record.getMessage()}"  # No level in the message
-        print(f"{level_color}{formatted_message}{Style.RESET_ALL}")
+        formatted_message = f"{self.color}[{self.name}] {message_formatter.format(record)}"  # No level in the message
+        terminal_writer.write(f"{level_color}{formatted_message}{Style.RESET_ALL}\n")
 
     def _get_level_color(self, levelname):
         """
@@ -238,8 +340,15 @@ class LogManager:
         }
         return color_map.get(levelname, Fore.WHITE)
 
+    def is_debug_enabled(self):
+        """
+        Return whether debug records are emitted, so hot paths can skip building messages.
+        """
+        return self.logger.isEnabledFor(logging.DEBUG)
+
     def debug(self, *args, **kwargs):
-        self.logger.debug(self._format_message(*args, **kwargs))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_message(*args, **kwargs))
 
     def info(self, *args, **kwargs):
         self.logger.info(self._format_message(*args, **kwargs))
@@ -248,10 +357,8 @@ class LogManager:
         self.logger.warning(self._format_message(*args, **kwargs))
 
     def error(self, *args, exception=None, **kwargs):
-        if exception:
-            traceback_details = "".join(traceback.format_exception(None, exception, exception.__traceback__))
-            kwargs["traceback"] = traceback_details
-        self.logger.error(self._format_message(*args, **kwargs))
+        # The traceback is formatted lazily by the handlers that actually emit the record
+        self.logger.error(self._format_message(*args, **kwargs), exc_info=exception)
 
     def _format_message(self, *args, **kwargs):
         """
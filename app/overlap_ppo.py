@@ -0,0 +1,189 @@
+# path: ./overlap_ppo.py
+
+import gym
+import numpy as np
+import torch as th
+from stable_baselines3 import PPO
+from stable_baselines3.common.utils import obs_as_tensor
+from stable_baselines3.common.vec_env import VecTransposeImage
+
+
+def _slice_obs(obs, rows):
+    """Select the environments in `rows` from a batched (possibly dict) observation."""
+    if isinstance(obs, dict):
+        return {key: value[rows] for key, value in obs.items()}
+    return obs[rows]
+
+
+class OverlappedPPO(PPO):
+    """
+    PPO whose rollout collection overlaps policy inference with environment stepping.
+
+    The training workers are split into two fixed halves. While one half is stepping,
+    the policy computes the next actions for the other half, so the forward pass is
+    hidden behind the environment step instead of running while every worker is idle.
+    Each rollout buffer column still belongs to one environment and every stored step
+    covers all of them, so the collected trajectories are the same as with plain PPO.
+
+    Falls back to the stock collector when the vec env cannot step its halves separately.
+
+    On CUDA, rollout observations are staged through reusable pinned host buffers and
+    copied to the GPU asynchronously. Frames stay uint8 through the transfer; the policy
+    casts and normalizes them on the device.
+    """
+
+    def _setup_model(self):
+        super()._setup_model()
+        # Pinned staging tensors keyed by (observation key, batch shape)
+        self._pinned_obs = {}
+
+    def _excluded_save_params(self):
+        return super()._excluded_save_params() + ["_pinned_obs"]
+
+    def _pinned_to_device(self, key, value):
+        """Copy one observation array to the device through its pinned staging buffer."""
+        value = np.asarray(value)
+        pinned = self._pinned_obs.get((key, value.shape))
+        if pinned is None or pinned[1].dtype != value.dtype:
+            tensor = th.from_numpy(np.empty_like(value)).pin_memory()
+            pinned = self._pinned_obs[(key, value.shape)] = (tensor, tensor.numpy())
+        # Safe to reuse: every forward pass copies its actions back, which waits for this transfer
+        np.copyto(pinned[1], value)
+        return pinned[0].to(self.device, non_blocking=True)
+
+    def _obs_to_device(self, obs):
+        """
+        Move a batch of observations to the policy device.
+
+        :param obs: Batched observation, a dict of arrays or a single array.
+        :return: The observation as device tensors.
+        """
+        if self.device.type != "cuda":
+            return obs_as_tensor(obs, self.device)
+        if isinstance(obs, dict):
+            return {key: self._pinned_to_device(key, value) for key, value in obs.items()}
+        return self._pinned_to_device(None, obs)
+
+    def _group_vec_env(self, env):
+        """
+        Find the innermost vec env if it can step its worker halves separately.
+
+        :param env: The (possibly wrapped) training vec env.
+        :return: The group-capable vec env, or None.
+        """
+        venv = env
+        while hasattr(venv, "venv"):
+            venv = venv.venv
+        if hasattr(venv, "step_group_async") and len(venv.worker_groups[1]) > 0:
+            return venv
+        return None
+
+    def _group_forward(self, env, obs, raw=True):
+        """
+        Run the policy on one half's observations.
+
+        :param env: The training vec env, used to apply its observation transforms.
+        :param obs: Observations of one half.
+        :param raw: Whether `obs` comes straight from the innermost vec env and still needs
+            the wrappers' transforms; False for slices of `_last_obs`, which already has them.
+        :return: Tuple of (actions, clipped actions, values, log probs).
+        """
+        wrapper = env
+        while raw and hasattr(wrapper, "venv"):
+            if isinstance(wrapper, VecTransposeImage):
+                obs = wrapper.transpose_observations(obs)
+            wrapper = wrapper.venv
+        with th.no_grad():
+            actions, values, log_probs = self.policy(self._obs_to_device(obs))
+        actions = actions.cpu().numpy()
+        clipped_actions = actions
+        if isinstance(self.action_space, gym.spaces.Box):
+            clipped_actions = np.clip(actions, self.action_space.low, self.action_space.high)
+        return actions, clipped_actions, values, log_probs
+
+    def collect_rollouts(self, env, callback, rollout_buffer, n_rollout_steps):
+        venv = self._group_vec_env(env)
+        if venv is None or self.use_sde:
+            return super().collect_rollouts(env, callback, rollout_buffer, n_rollout_steps)
+
+        assert self._last_obs is not None, "No previous observation was provided"
+        # Switch to eval mode (this affects batch norm / dropout)
+        self.policy.set_training_mode(False)
+
+        n_steps = 0
+        rollout_buffer.reset()
+        callback.on_rollout_start()
+
+        groups = (0, 1)
+        rows = [venv.env_group_slice(group) for group in groups]
+
+        # Start both halves on the first step of the rollout
+        pending = []
+        for group in groups:
+            step = self._group_forward(env, _slice_obs(self._last_obs, rows[group]), raw=False)
+            venv.step_group_async(group, step[1])
+            pending.append(step)
+
+        while n_steps < n_rollout_steps:
+            # The last step's successors belong to the next rollout, which runs on an updated policy
+            prefetch = n_steps + 1 < n_rollout_steps
+            upcoming = []
+            for group in groups:
+                group_obs = venv.step_group_wait(group)
+                if prefetch:
+                    # This half's next actions are computed while the other half is still stepping
+                    step = self._group_forward(env, group_obs)
+                    venv.step_group_async(group, step[1])
+                    upcoming.append(step)
+
+            new_obs, rewards, dones, infos = env.step_wait()
+            actions = np.concatenate([step[0] for step in pending])
+            clipped_actions = np.concatenate([step[1] for step in pending])
+            values = th.cat([step[2] for step in pending])
+            log_probs = th.cat([step[3] for step in pending])
+
+            self.num_timesteps += env.num_envs
+
+            # Give access to local variables
+            callback.update_locals(locals())
+            if callback.on_step() is False:
+                if prefetch:
+                    # Finish the step already in flight so the workers are left idle
+                    for group in groups:
+                        venv.step_group_wait(group)
+                    self._last_obs, _, self._last_episode_starts, _ = env.step_wait()
+                return False
+
+            self._update_info_buffer(infos)
+            n_steps += 1
+
+            if isinstance(self.action_space, gym.spaces.Discrete):
+                # Reshape in case of discrete action
+                actions = actions.reshape(-1, 1)
+
+            # Handle timeout by bootstraping with value function
+            for idx, done in enumerate(dones):
+                if (
+                    done
+                    and infos[idx].get("terminal_observation") is not None
+                    and infos[idx].get("TimeLimit.truncated", False)
+                ):
+                    terminal_obs = self.policy.obs_to_tensor(infos[idx]["terminal_observation"])[0]
+                    with th.no_grad():
+                        terminal_value = self.policy.predict_values(terminal_obs)[0]
+                    rewards[idx] += self.gamma * terminal_value
+
+            rollout_buffer.add(self._last_obs, actions, rewards, self._last_episode_starts, values, log_probs)
+            self._last_obs = new_obs
+            self._last_episode_starts = dones
+            pending = upcoming
+
+        with th.no_grad():
+            # Compute value for the last timestep
+            values = self.policy.predict_values(self._obs_to_device(new_obs))
+
+        rollout_buffer.compute_returns_and_advantage(last_values=values, dones=dones)
+
+        callback.on_rollout_end()
+
+        return True
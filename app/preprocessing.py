@@ -2,7 +2,6 @@
 
 import gym
 import numpy as np
-import collections
 import cv2
 from stable_baselines3.common.torch_layers import BaseFeaturesExtractor
 import torch
@@ -11,6 +10,10 @@ from log_manager import LogManager
 
 logger = LogManager("preprocessing")
 
+# Frames here are tiny; OpenCV's own thread pool only competes with the env workers and torch
+cv2.setNumThreads(1)
+cv2.ocl.setUseOpenCL(False)
+
 
 class MarioFeatureExtractor(BaseFeaturesExtractor):
     """
@@ -20,10 +23,26 @@ class MarioFeatureExtractor(BaseFeaturesExtractor):
     def __init__(self, observation_space, features_dim=128):
         super(MarioFeatureExtractor, self).__init__(observation_space, features_dim)
 
-        frame_shape = observation_space["frame"].shape
-        self.frame_extractor = nn.Sequential(
+        # Nature-CNN stack over the channel-first frame
+        frame_space = observation_space["frame"]
+        frame_cnn = nn.Sequential(
+            nn.Conv2d(frame_space.shape[0], 32, kernel_size=8, stride=4),
+            nn.ReLU(),
+            nn.Conv2d(32, 64, kernel_size=4, stride=2),
+            nn.ReLU(),
+            nn.Conv2d(64, 64, kernel_size=3, stride=1),
+            nn.ReLU(),
             nn.Flatten(),
-            nn.Linear(frame_shape[0] * frame_shape[1] * frame_shape[2], 256),
+        )
+
+        # Compute the flattened conv output size with a single dummy forward pass
+        with torch.no_grad():
+            sample_frame = torch.as_tensor(frame_space.sample()[None]).float()
+            n_flatten = frame_cnn(sample_frame).shape[1]
+
+        self.frame_extractor = nn.Sequential(
+            frame_cnn,
+            nn.Linear(n_flatten, 256),
             nn.ReLU()
         )
 
@@ -53,7 +72,20 @@ class MaxAndSkipEnv(gym.Wrapper):
     def __init__(self, env, skip=4):
         super(MaxAndSkipEnv, self).__init__(env)
         self.skip = skip
-        self.obs_buffer = collections.deque(maxlen=2)
+        # Two rotating frame slots and the max output, allocated on the first observation
+        self._f0 = None
+        self._f1 = None
+        self._max_buf = None
+
+    def _store_frame(self, obs):
+        """Rotate the frame slots and copy the newest observation into the freed one."""
+        if self._max_buf is None:
+            self._f0 = np.array(obs, copy=True)
+            self._f1 = np.array(obs, copy=True)
+            self._max_buf = np.empty_like(obs)
+            return
+        self._f0, self._f1 = self._f1, self._f0
+        np.copyto(self._f1, obs)
 
     def step(self, action):
         total_reward = 0.0
@@ -61,18 +93,19 @@ class MaxAndSkipEnv(gym.Wrapper):
 
         for _ in range(self.skip):
             obs, reward, done, info = self.env.step(action)
-            self.obs_buffer.append(obs)
+            self._store_frame(obs)
             total_reward += reward
             if done:
                 break
 
-        max_frame = np.max(np.stack(self.obs_buffer), axis=0)
-        return max_frame, total_reward, done, info
+        # The returned buffer is reused on the next step; downstream wrappers must not keep it
+        np.maximum(self._f0, self._f1, out=self._max_buf)
+        return self._max_buf, total_reward, done, info
 
     def reset(self, **kwargs):
-        self.obs_buffer.clear()
         obs = self.env.reset(**kwargs)
-        self.obs_buffer.append(obs)
+        self._store_frame(obs)
+        np.copyto(self._f0, obs)
         return obs
 
 
@@ -90,16 +123,20 @@ class MarioRescale84x84(gym.ObservationWrapper):
 
     @staticmethod
     def process(frame):
-        img = frame.astype(np.float32)
-        img = img[:, :, 0] * 0.299 + img[:, :, 1] * 0.587 + img[:, :, 2] * 0.114
-        resized_screen = cv2.resize(img, (84, 110), interpolation=cv2.INTER_AREA)
+        # cvtColor applies the same BT.601 weights (0.299/0.587/0.114) directly on uint8,
+        # avoiding the float32 round trip
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+        resized_screen = cv2.resize(gray, (84, 110), interpolation=cv2.INTER_AREA)
         cropped_screen = resized_screen[18:102, :]
-        return np.expand_dims(cropped_screen, axis=-1).astype(np.uint8)
+        return cropped_screen[..., None]
 
 
 class ImageToPyTorch(gym.ObservationWrapper):
     """
     Wrapper to convert image observations to PyTorch format.
+
+    Frames stay uint8; SB3 treats a channel-first uint8 Box as an image and scales it to
+    [0, 1] on the policy device, so normalizing here would only quadruple the bytes.
     """
 
     def __init__(self, env):
@@ -107,23 +144,15 @@ class ImageToPyTorch(gym.ObservationWrapper):
         old_shape = self.observation_space["frame"].shape
         self.observation_space = gym.spaces.Dict({
             "frame": gym.spaces.Box(
-                low=0.0, high=1.0, shape=(old_shape[-1], old_shape[0], old_shape[1]), dtype=np.float32
+                low=0, high=255, shape=(old_shape[-1], old_shape[0], old_shape[1]), dtype=np.uint8
             ),
             "stats": env.observation_space["stats"]
         })
 
     def observation(self, observation):
+        # Transpose to CHW into a contiguous uint8 buffer
+        frame = np.ascontiguousarray(np.transpose(observation["frame"], (2, 0, 1)))
         return {
-            "frame": np.moveaxis(observation["frame"], 2, 0),
+            "frame": frame,
             "stats": observation["stats"]
         }
-
-
-class PixelNormalization(gym.ObservationWrapper):
-    """
-    Wrapper to normalize pixel values to the range [0, 1].
-    """
-
-    def observation(self, obs):
-        obs["frame"] = obs["frame"] / 255.0
-        return obs
\ No newline at end of file
@@ -1,6 +1,7 @@
 # path: ./render_manager.py
 
 import torch
+from stable_baselines3.common.preprocessing import is_image_space, maybe_transpose
 from log_manager import LogManager
 import threading
 import time
@@ -12,20 +13,103 @@ import numpy as np
 # Initialize a logger specific to this module
 logger = LogManager("RenderMan")
 
-frame_queue = queue.Queue(maxsize=50)
+
+class LatestFrameSlot:
+    """
+    Double-buffered hand-off of the most recent rendered frame.
+
+    The renderer publishes into the slot the reader is not using and flips the index;
+    the reader waits on an Event and takes whatever frame is newest. Older frames are
+    simply overwritten, so there is no queue to fill up or drain.
+    """
+
+    def __init__(self):
+        self._buf = [None, None]
+        self._w = 0
+        self._ready = threading.Event()
+
+    def publish(self, frame):
+        """Make `frame` the latest frame and wake the reader."""
+        w = self._w ^ 1
+        self._buf[w] = frame
+        self._w = w
+        self._ready.set()
+
+    def get(self, timeout=None):
+        """
+        Wait for a frame newer than the last one taken.
+
+        :param timeout: Seconds to wait; None waits indefinitely.
+        :return: The latest frame, or None if none was published in time.
+        """
+        if not self._ready.wait(timeout):
+            return None
+        self._ready.clear()
+        return self._buf[self._w]
+
+    def clear(self):
+        """Drop the published frames."""
+        self._ready.clear()
+        self._buf = [None, None]
+
+
+frame_queue = LatestFrameSlot()
+
+# MJPEG parts encoded off the HTTP generator, ready to be yielded as-is
+encoded_queue = queue.Queue(maxsize=50)
+JPEG_PARAMS = [int(cv2.IMWRITE_JPEG_QUALITY), 80]
+
+_encoder_thread = None
+_encoder_lock = threading.Lock()
 
 
 def clear_frame_queue():
     """
-    Clears all frames from the frame queue.
+    Clears the latest frame slot and all frames from the encoded frame queue.
     """
-    discarded_frames = 0
-    while not frame_queue.empty():
-        frame_queue.get_nowait()
-        discarded_frames += 1
+    frame_queue.clear()
+    # Clear the backing deque under one lock acquisition instead of draining item by item
+    with encoded_queue.mutex:
+        discarded_frames = len(encoded_queue.queue)
+        encoded_queue.queue.clear()
+        encoded_queue.unfinished_tasks = 0
+        encoded_queue.not_full.notify_all()
     logger.info("Frame queue cleared", discarded_frames=discarded_frames)
 
 
+def _encoder_loop():
+    """Encode rendered frames to MJPEG parts and hand them to the stream generators."""
+    while True:
+        frame = frame_queue.get()
+        if frame is None:
+            continue
+        try:
+            # Frames are published in BGR, so they go straight to the encoder
+            _, buffer = cv2.imencode('.jpg', frame, JPEG_PARAMS)
+            part = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n' + buffer.tobytes() + b'\r\n'
+            if encoded_queue.full():
+                encoded_queue.get_nowait()  # Drop the oldest encoded frame
+            encoded_queue.put_nowait(part)
+        except queue.Empty:
+            pass
+        except queue.Full:
+            logger.debug("Encoded frame queue is full; skipping frame.")
+        except Exception as e:
+            logger.error("Error encoding frame.", exception=e)
+
+
+def start_frame_encoder():
+    """
+    Start the frame encoder thread if it is not already running.
+    """
+    global _encoder_thread
+    with _encoder_lock:
+        if _encoder_thread is None or not _encoder_thread.is_alive():
+            _encoder_thread = threading.Thread(target=_encoder_loop, daemon=True)
+            _encoder_thread.start()
+            logger.debug("Frame encoder thread started.")
+
+
 def apply_crt_shader(frame, time, rolling_interval=3, shader_options=None):
     """
     Apply a CRT-like shader effect with togglable steps.
@@ -104,7 +188,7 @@ def apply_crt_shader(frame, time, rolling_interval=3, shader_options=None):
 
 def render_frame_to_queue(frame, shader_options):
     """
-    Render a frame, apply shader effects, and place it in the frame queue.
+    Render a frame, apply shader effects, and publish it as the latest frame in BGR order.
 
     :param frame: The rendered frame (as a NumPy array).
     :param shader_options: Dictionary containing shader effect toggles.
@@ -115,14 +199,10 @@ def render_frame_to_queue(frame, shader_options):
             frame, current_time, rolling_interval=1, shader_options=shader_options
         )
 
-        if frame_queue.full():
-            discarded_frame = frame_queue.get_nowait()  # Discard the oldest frame
-            logger.debug("Discarded oldest frame to make room in queue.", discarded_frame=discarded_frame)
-
-        frame_queue.put_nowait(processed_frame)
-        logger.debug("Frame added to queue successfully.")
-    except queue.Full:
-        logger.warning("Frame queue is full; skipping frame.")
+        # The shader output is a fresh array, so the channel swap for OpenCV is done in place
+        cv2.cvtColor(processed_frame, cv2.COLOR_RGB2BGR, dst=processed_frame)
+        frame_queue.publish(processed_frame)
+        logger.debug("Frame published successfully.")
     except Exception as e:
         logger.error("Rendering failed", exception=e)
 
@@ -132,14 +212,13 @@ def render_frame_to_queue(frame, shader_options):
 def generate_frame_stream(frame_rate=120):
     """
     Generator function to stream frames as MJPEG.
+    Frames are encoded by the encoder thread, so this only yields ready-made parts.
     """
+    start_frame_encoder()
     interval = 1.0 / frame_rate
     while True:
         try:
-            frame = frame_queue.get(timeout=1)  # Avoid indefinite blocking
-            _, buffer = cv2.imencode('.jpg', cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
-            yield (b'--frame\r\n'
-                   b'Content-Type: image/jpeg\r\n\r\n' + buffer.tobytes() + b'\r\n')
+            yield encoded_queue.get(timeout=1)  # Avoid indefinite blocking
             time.sleep(interval)
         except queue.Empty:
             logger.debug("Frame queue is empty; waiting for new frames.")
@@ -152,7 +231,7 @@ class RenderManager:
     """
     Manages rendering in a separate thread to ensure it does not block training.
     """
-    def __init__(self, render_env, model, cache_update_interval=120, training_active_flag=None, model_updated_flag=None, shader_settings_flag=None):
+    def __init__(self, render_env, model, cache_update_interval=120, training_active_flag=None, model_updated_flag=None, shader_settings_flag=None, frame_tick=None, idle_timeout=0.5):
         if render_env is None or model is None:
             raise ValueError("Both 'render_env' and 'model' must be provided to initialize RenderManager.")
 
@@ -167,31 +246,102 @@ class RenderManager:
         self.shader_settings_flag = shader_settings_flag or (lambda: {})  # Default to empty settings
         self.model_updated_flag = model_updated_flag or threading.Event()
         self.rendering_active = threading.Event()
+        # Set by the training loop as it steps; the render game logic only advances on a tick
+        self.frame_tick = frame_tick
+        self.idle_timeout = idle_timeout
 
         try:
             self.cached_policy = deepcopy(self.model.policy)
+            # Run the cached policy's forward pass in reduced precision on CUDA
+            self.autocast_enabled = self.cached_policy.device.type == "cuda"
+            self.autocast_dtype = (
+                torch.bfloat16 if self.autocast_enabled and torch.cuda.is_bf16_supported() else torch.float16
+            )
+            # On CUDA, observations are staged through reusable pinned buffers and the
+            # render forward pass runs on its own stream, away from the training kernels
+            self._stream = torch.cuda.Stream(device=self.cached_policy.device) if self.autocast_enabled else None
+            self._pinned_obs = {}
+            # Tensors of the cached policy, updated in place on every refresh
+            self._cached_state = self.cached_policy.state_dict()
             logger.info("RenderManager initialized successfully with a cached policy.")
         except Exception as e:
             logger.error("Failed to initialize cached policy during RenderManager initialization.", exception=e)
             raise
 
     def _cache_policy(self):
-        """Update the cached policy with a thread-safe copy."""
+        """Update the cached policy by copying the training weights into it in place."""
         try:
-            self.cached_policy.load_state_dict(deepcopy(self.model.policy.state_dict()))
+            source_state = self.model.policy.state_dict()
+            copy_stream = None
+            if self._stream is not None:
+                # Don't overwrite the weights while a queued render forward pass still reads them
+                copy_stream = torch.cuda.current_stream(self.cached_policy.device)
+                copy_stream.wait_stream(self._stream)
+            with torch.no_grad():
+                for name, tensor in self._cached_state.items():
+                    tensor.copy_(source_state[name], non_blocking=True)
+            if copy_stream is not None:
+                # Order the render stream's next forward pass after the weight copies
+                self._stream.wait_stream(copy_stream)
             logger.debug("Cached policy updated successfully.")
         except Exception as e:
             logger.error("Error while updating cached policy.", exception=e)
 
 
+    def _predict_actions(self, obs):
+        """
+        Predict deterministic actions for a batch of render observations.
+
+        :param obs: Batched dict observation from the render environments.
+        :return: NumPy array of actions, one per render environment.
+        """
+        if self._stream is None:
+            actions, _ = self.cached_policy.predict(obs, deterministic=True)
+            return actions
+
+        with torch.cuda.stream(self._stream):
+            obs_tensor = {}
+            for key, space in self.cached_policy.observation_space.spaces.items():
+                value = maybe_transpose(obs[key], space) if is_image_space(space) else obs[key]
+                value = np.asarray(value).reshape((-1,) + space.shape)
+
+                pinned = self._pinned_obs.get(key)
+                if pinned is None or pinned[1].shape != value.shape:
+                    tensor = torch.empty(value.shape, dtype=torch.from_numpy(value).dtype).pin_memory()
+                    pinned = self._pinned_obs[key] = (tensor, tensor.numpy())
+                np.copyto(pinned[1], value)
+                obs_tensor[key] = pinned[0].to(self.cached_policy.device, non_blocking=True)
+
+            actions = self.cached_policy._predict(obs_tensor, deterministic=True)
+            # Copying back on the render stream also waits for its forward pass to finish
+            return actions.cpu().numpy()
+
+    def _take_frame_tick(self):
+        """Consume a pending training tick; without a tick source the logic always advances."""
+        if self.frame_tick is None:
+            return True
+        if self.frame_tick.is_set():
+            self.frame_tick.clear()
+            return True
+        return False
+
+    def _render_frame(self):
+        """Render the first environment of the batch, which is the one streamed to the UI."""
+        return self.render_env.env_method("render", mode="rgb_array", indices=[0])[0]
+
     def _render_loop(self, target_render_fps=60, logic_fps=12):
         """
         Rendering loop with separate timing for logic updates and frame rendering.
+
+        The render environments are stepped as a batch so the cached policy runs one
+        forward pass per logic update; only the first environment is streamed. Logic
+        updates wait for the training loop to tick, and the thread sleeps until the next
+        frame is due instead of polling.
         """
         try:
             self.obs = self.render_env.reset()
             self.rendering_active.set()
-            logger.info("Rendering thread started successfully.")
+            logger.info("Rendering thread started successfully.", num_envs=self.render_env.num_envs)
 
             render_interval = 1 / target_render_fps
             logic_interval = 1 / logic_fps
@@ -199,7 +349,7 @@ class RenderManager:
             last_render_time = time.time()
             last_logic_time = last_render_time
 
-            last_logic_frame = self.render_env.render(mode="rgb_array")
+            last_logic_frame = self._render_frame()
             current_logic_frame = last_logic_frame
 
             while not self.done_event.is_set():
@@ -212,26 +362,30 @@ class RenderManager:
                     self.model_updated_flag.clear()
 
                 current_time = time.time()
+                logic_due = current_time - last_logic_time >= logic_interval
 
-                # Update game logic
-                if current_time - last_logic_time >= logic_interval:
+                # Update game logic once training has stepped since the last update
+                if logic_due and self._take_frame_tick():
                     try:
-                        with torch.no_grad():
-                            action, _ = self.cached_policy.predict(self.obs, deterministic=True)
-                        self.obs, _, done, _ = self.render_env.step(action)
+                        with torch.inference_mode(), torch.autocast(
+                            device_type=self.cached_policy.device.type,
+                            dtype=self.autocast_dtype,
+                            enabled=self.autocast_enabled,
+                        ):
+                            actions = self._predict_actions(self.obs)
+                        # The vectorized env resets finished episodes on its own
+                        self.obs, _, _, _ = self.render_env.step(actions)
 
                         last_logic_frame = current_logic_frame
-                        current_logic_frame = self.render_env.render(mode="rgb_array")
-
-                        if done:
-                            self.obs = self.render_env.reset()
+                        current_logic_frame = self._render_frame()
                     except Exception as e:
                         logger.error("Error during logic update.", exception=e)
 
                     last_logic_time = current_time
+                    logic_due = False
 
-                # Render a frame
-                if current_time - last_render_time >= render_interval:
+                # Render interpolated frames until the current logic frame is reached
+                if not logic_due and current_time - last_render_time >= render_interval:
                     try:
                         alpha = (current_time - last_logic_time) / logic_interval
                         alpha = max(0.0, min(1.0, alpha))
@@ -247,7 +401,13 @@ class RenderManager:
 
                     last_render_time = current_time
 
-                time.sleep(0.001)  # Prevent busy-waiting
+                if logic_due:
+                    # Nothing changes on screen until training steps again
+                    if self.frame_tick is not None:
+                        self.frame_tick.wait(timeout=self.idle_timeout)
+                else:
+                    next_frame_time = min(last_logic_time + logic_interval, last_render_time + render_interval)
+                    self.done_event.wait(timeout=max(0.0, next_frame_time - time.time()))
         except Exception as e:
             logger.error("Rendering loop failed.", exception=e)
         finally:
@@ -286,13 +446,12 @@ class RenderManager:
         return self.rendering_active.is_set()
 
     def _update_policy_loop(self):
-        """Periodically update the cached policy."""
+        """Periodically update the cached policy, waking immediately when rendering stops."""
         try:
-            while not self.done_event.is_set():
+            while not self.done_event.wait(timeout=self.cache_update_interval):
                 if not self.training_active_flag():
                     logger.info("Training has stopped, halting policy updates.")
                     break
-                time.sleep(self.cache_update_interval)
                 self._cache_policy()
         except Exception as e:
             logger.error("Error during policy update loop.", exception=e)
@@ -302,6 +461,8 @@ class RenderManager:
         try:
             logger.info("Stopping rendering thread.")
             self.done_event.set()
+            if self.frame_tick is not None:
+                self.frame_tick.set()  # Wake a render loop waiting for training to step
             if self.render_thread:
                 self.render_thread.join()
             clear_frame_queue()
@@ -1,8 +1,42 @@
 # path: routes/config_routes.py
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, request
 from pathlib import Path
-import json
+import copy
+import functools
+import os
+import orjson
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_config_file(path, mtime_ns):
+    """
+    Parse a configuration file. Cached per path and modification time, so an
+    edited file is re-read while repeated loads of an unchanged one are free.
+    """
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def json_response(payload):
+    """
+    Serialize `payload` with orjson into a JSON response.
+
+    :param payload: JSON-serializable object to send.
+    :return: Flask response with an application/json body.
+    """
+    return Response(orjson.dumps(payload), mimetype="application/json")
+
+
+def read_config_file(config_path):
+    """
+    Return a private copy of the parsed configuration stored at `config_path`.
+
+    :param config_path: Path of the JSON configuration file.
+    :return: Configuration dictionary that callers may mutate freely.
+    """
+    config_data = _parse_config_file(str(config_path), config_path.stat().st_mtime_ns)
+    return copy.deepcopy(config_data)
 
 
 def create_config_blueprint(training_manager, app_logger):
@@ -14,7 +48,7 @@ def create_config_blueprint(training_manager, app_logger):
     :return: Config blueprint.
     """
     # Create a scoped logger
-    logger = app_logger.__class__("config_routes")
+    logger = app_logger.for_name("config_routes")
 
     config_blueprint = Blueprint("config_routes", __name__)
 
@@ -22,49 +56,56 @@ def create_config_blueprint(training_manager, app_logger):
     CONFIG_DIR = Path("./configs")
     CONFIG_DIR.mkdir(exist_ok=True)  # Ensure the directory exists
 
+    # Known configuration names, kept in sync by save/delete instead of globbing per request
+    with os.scandir(CONFIG_DIR) as entries:
+        config_names = {
+            entry.name[:-5] for entry in entries
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        }
+
     @config_blueprint.route("/save_config", methods=["POST"])
     def save_config():
         """Save a configuration."""
         data = request.json
         if not data:
-            return jsonify({"status": "error", "message": "Invalid request payload."}), 400
+            return json_response({"status": "error", "message": "Invalid request payload."}), 400
 
         config_name = data.get("name")
         config_data = data.get("config")
         overwrite = data.get("overwrite", False)
 
         if not config_name or not config_data:
-            return jsonify({"status": "error", "message": "Name and configuration data are required."}), 400
+            return json_response({"status": "error", "message": "Name and configuration data are required."}), 400
 
         if config_name.lower() == "default":
-            return jsonify({"status": "error", "message": "Cannot overwrite the Default configuration."}), 403
+            return json_response({"status": "error", "message": "Cannot overwrite the Default configuration."}), 403
 
         config_path = CONFIG_DIR / f"{config_name}.json"
         if config_path.exists() and not overwrite:
-            return jsonify({
+            return json_response({
                 "status": "error",
                 "message": f"Configuration '{config_name}' already exists. Use 'overwrite=true' to update it."
             }), 409
 
         try:
-            with config_path.open("w") as f:
-                json.dump(config_data, f, indent=4)
+            config_path.write_bytes(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            _parse_config_file.cache_clear()
+            config_names.add(config_name)
             logger.info(f"Configuration '{config_name}' saved successfully.")
-            return jsonify({"status": "success", "message": f"Configuration '{config_name}' saved."})
+            return json_response({"status": "success", "message": f"Configuration '{config_name}' saved."})
         except Exception as e:
             logger.error(f"Error saving configuration '{config_name}': {e}")
-            return jsonify({"status": "error", "message": f"Failed to save configuration '{config_name}'."}), 500
+            return json_response({"status": "error", "message": f"Failed to save configuration '{config_name}'."}), 500
 
     @config_blueprint.route("/load_config/<name>", methods=["GET"])
     def load_config(name):
         """Load a configuration by name."""
         config_path = CONFIG_DIR / f"{name}.json"
         if not config_path.exists():
-            return jsonify({"status": "error", "message": f"Configuration '{name}' not found."}), 404
+            return json_response({"status": "error", "message": f"Configuration '{name}' not found."}), 404
 
         try:
-            with config_path.open() as f:
-                config_data = json.load(f)
+            config_data = read_config_file(config_path)
 
             # Ensure required wrappers and callbacks are included
             required_wrappers = [
@@ -81,43 +122,45 @@ def create_config_blueprint(training_manager, app_logger):
             training_manager.set_active_config(config_data)
 
             logger.info(f"Configuration '{name}' loaded and applied to TrainingManager successfully.")
-            return jsonify({"status": "success", "config": config_data})
-        except json.JSONDecodeError:
+            return json_response({"status": "success", "config": config_data})
+        except orjson.JSONDecodeError:
             logger.error(f"Invalid JSON format in configuration '{name}'.")
-            return jsonify({"status": "error", "message": f"Configuration '{name}' is corrupted."}), 500
+            return json_response({"status": "error", "message": f"Configuration '{name}' is corrupted."}), 500
         except Exception as e:
             logger.error(f"Error loading configuration '{name}': {e}")
-            return jsonify({"status": "error", "message": f"Failed to load configuration '{name}'."}), 500
+            return json_response({"status": "error", "message": f"Failed to load configuration '{name}'."}), 500
 
 
     @config_blueprint.route("/delete_config/<name>", methods=["DELETE"])
     def delete_config(name):
         """Delete a configuration."""
         if name.lower() == "default":
-            return jsonify({"status": "error", "message": "Cannot delete the Default configuration."}), 403
+            return json_response({"status": "error", "message": "Cannot delete the Default configuration."}), 403
 
         config_path = CONFIG_DIR / f"{name}.json"
         if not config_path.exists():
-            return jsonify({"status": "error", "message": f"Configuration '{name}' not found."}), 404
+            return json_response({"status": "error", "message": f"Configuration '{name}' not found."}), 404
 
         try:
             config_path.unlink()
+            config_names.discard(name)
+            _parse_config_file.cache_clear()
             logger.info(f"Configuration '{name}' deleted successfully.")
-            return jsonify({"status": "success", "message": f"Configuration '{name}' deleted."})
+            return json_response({"status": "success", "message": f"Configuration '{name}' deleted."})
         except Exception as e:
             logger.error(f"Error deleting configuration '{name}': {e}")
-            return jsonify({"status": "error", "message": f"Failed to delete configuration '{name}'."}), 500
+            return json_response({"status": "error", "message": f"Failed to delete configuration '{name}'."}), 500
 
     @config_blueprint.route("/list_configs", methods=["GET"])
     def list_configs():
         """List all configurations."""
         try:
-            configs = [p.stem for p in CONFIG_DIR.glob("*.json")]
+            configs = sorted(config_names)
             logger.debug(f"Listed configurations: {configs}")
-            return jsonify({"status": "success", "configs": configs})
+            return json_response({"status": "success", "configs": configs})
         except Exception as e:
             logger.error(f"Error listing configurations: {e}")
-            return jsonify({"status": "error", "message": "Failed to list configurations."}), 500
+            return json_response({"status": "error", "message": "Failed to list configurations."}), 500
 
     @config_blueprint.route("/load_default_config", methods=["GET"])
     def load_default_config():
@@ -143,9 +186,9 @@ def create_config_blueprint(training_manager, app_logger):
             training_manager.set_active_config(default_config)
 
             logger.info("Default configuration loaded successfully.")
-            return jsonify({"status": "success", "config": default_config})
+            return json_response({"status": "success", "config": default_config})
         except Exception as e:
             logger.error(f"Error loading default configuration: {e}")
-            return jsonify({"status": "error", "message": "Failed to load default configuration."}), 500
+            return json_response({"status": "error", "message": "Failed to load default configuration."}), 500
 
     return config_blueprint
@@ -1,10 +1,33 @@
 # path: routes/dashboard_routes.py
 
 from flask import Blueprint, render_template, jsonify, request
-from gui import DEFAULT_HYPERPARAMETERS, DEFAULT_TRAINING_CONFIG, DEFAULT_PATHS
-from utils import load_blueprints  # Ensure this is correctly defined elsewhere
+from log_manager import LogManager
+from types import MappingProxyType
+import functools
 import importlib
-import inspect
+
+logger = LogManager.for_name("dashboard_routes")
+
+
+@functools.lru_cache(maxsize=None)
+def dynamic_load_blueprints(module_name):
+    """
+    Dynamically load all blueprint instances from a module.
+    The scan runs once per module; callers share a read-only view of the result.
+    """
+    from utils import load_blueprints  # Deferred: pulls in the environment stack
+
+    try:
+        module = importlib.import_module(module_name)
+        blueprints = {
+            name: obj for name, obj in vars(module).items()
+            if type(obj) is load_blueprints  # Ensure only load_blueprints instances are loaded
+        }
+        logger.debug(f"Loaded blueprints from {module_name}: {list(blueprints.keys())}")
+        return MappingProxyType(blueprints)
+    except Exception as e:
+        logger.error(f"Error loading blueprints from {module_name}: {e}")
+        return MappingProxyType({})
 
 
 def create_dashboard_blueprint(training_manager, app_logger, DBManager):
@@ -16,37 +39,30 @@ def create_dashboard_blueprint(training_manager, app_logger, DBManager):
     :return: Dashboard blueprint.
     """
     # Create a new logger for this blueprint
-    logger = app_logger.__class__("dashboard_routes")  # Create a scoped logger
+    logger = app_logger.for_name("dashboard_routes")  # Create a scoped logger
 
     # Initialize the dashboard blueprint
     dashboard_blueprint = Blueprint("dashboard", __name__)
 
-    def dynamic_load_blueprints(module_name):
-        """
-        Dynamically load all blueprint instances from a module.
-        """
-        try:
-            module = importlib.import_module(module_name)
-            blueprints = {
-                name: obj for name, obj in inspect.getmembers(module)
-                if isinstance(obj, load_blueprints)  # Ensure only load_blueprints instances are loaded
-            }
-            logger.debug(f"Loaded blueprints from {module_name}: {list(blueprints.keys())}")
-            return blueprints
-        except Exception as e:
-            logger.error(f"Error loading blueprints from {module_name}: {e}")
-            return {}
+    # Compile the dashboard templates when the blueprint is registered
+    @dashboard_blueprint.record_once
+    def warm_templates(state):
+        for template in ("training_dashboard.html", "metrics_dashboard.html"):
+            state.app.jinja_env.get_template(template)
 
     # Load blueprints for wrappers and callbacks dynamically
     wrapper_blueprints = dynamic_load_blueprints("app_wrappers")
     callback_blueprints = dynamic_load_blueprints("app_callbacks")
 
-    @dashboard_blueprint.route("/dashboard/training", methods=["GET"])
-    def training_dashboard():
-        """
-        Render the main training dashboard.
-        """
-        wrappers = [
+    from gui import DEFAULT_HYPERPARAMETERS, DEFAULT_TRAINING_CONFIG, DEFAULT_PATHS
+
+    # The blueprints are fixed at startup, so the dashboard context is built once
+    training_dashboard_context = {
+        "title": "Training Dashboard",
+        "hyperparameters": DEFAULT_HYPERPARAMETERS,
+        "training_config": DEFAULT_TRAINING_CONFIG,
+        "paths": DEFAULT_PATHS,
+        "wrappers": [
             {
                 "name": bp.name,
                 "description": bp.description,
@@ -54,25 +70,23 @@ def create_dashboard_blueprint(training_manager, app_logger, DBManager):
                 "component_class": bp.component_class.__name__,
             }
             for bp in wrapper_blueprints.values()
-        ]
-        callbacks = [
+        ],
+        "callbacks": [
             {
                 "name": bp.name,
                 "description": bp.description,
                 "required": bp.required,
             }
             for bp in callback_blueprints.values()
-        ]
-
-        return render_template(
-            "training_dashboard.html",
-            title="Training Dashboard",
-            hyperparameters=DEFAULT_HYPERPARAMETERS,
-            training_config=DEFAULT_TRAINING_CONFIG,
-            paths=DEFAULT_PATHS,
-            wrappers=wrappers,
-            callbacks=callbacks,
-        )
+        ],
+    }
+
+    @dashboard_blueprint.route("/dashboard/training", methods=["GET"])
+    def training_dashboard():
+        """
+        Render the main training dashboard.
+        """
+        return render_template("training_dashboard.html", **training_dashboard_context)
 
     @dashboard_blueprint.route("/dashboard/metrics", methods=["GET"])
     def metrics_dashboard():
@@ -4,6 +4,84 @@ from flask import Response, Blueprint
 from render_manager import generate_frame_stream
 from log_manager import log_queue
 import queue
+import threading
+
+# Seconds between SSE comment frames sent to keep idle log streams open
+SSE_KEEPALIVE_INTERVAL = 15
+
+# Log entries buffered per connected dashboard before the oldest are dropped
+SUBSCRIBER_BUFFER_SIZE = 256
+
+SSE_KEEPALIVE_FRAME = b": keepalive\n\n"
+
+# Most SSE events coalesced into one write when log lines arrive in a burst
+SSE_MAX_BATCH = 64
+
+_subscribers = set()
+_subscribers_lock = threading.Lock()
+_broker_thread = None
+
+
+def _offer(subscriber, log_entry):
+    """Queue a log entry for one subscriber, dropping its oldest entry if it is full."""
+    try:
+        subscriber.put_nowait(log_entry)
+    except queue.Full:
+        try:
+            subscriber.get_nowait()
+            subscriber.put_nowait(log_entry)
+        except (queue.Empty, queue.Full):
+            pass
+
+
+def sse_frame(log_entry):
+    """
+    Encode a log entry as a server-sent event, prefixing every line with `data:`.
+
+    :param log_entry: Log message as text or UTF-8 bytes.
+    :return: Complete SSE event as bytes.
+    """
+    if isinstance(log_entry, str):
+        log_entry = log_entry.encode()
+    return b"".join(b"data: " + line + b"\n" for line in log_entry.split(b"\n")) + b"\n"
+
+
+def _broadcast_logs():
+    """
+    Read each entry from the shared log queue once, frame it as an SSE event and
+    fan the encoded bytes out to every subscriber.
+    """
+    for log_entry in iter(log_queue.get, None):
+        with _subscribers_lock:
+            subscribers = list(_subscribers)
+        if not subscribers:
+            continue
+        frame = sse_frame(log_entry)
+        for subscriber in subscribers:
+            _offer(subscriber, frame)
+
+
+def subscribe_to_logs(buffer_size=SUBSCRIBER_BUFFER_SIZE):
+    """
+    Register a new log subscriber, starting the broker thread on first use.
+
+    :param buffer_size: Maximum number of entries buffered for this subscriber.
+    :return: Queue that receives every log entry published after subscribing, as SSE bytes.
+    """
+    global _broker_thread
+    subscriber = queue.Queue(maxsize=buffer_size)
+    with _subscribers_lock:
+        if _broker_thread is None:
+            _broker_thread = threading.Thread(target=_broadcast_logs, name="log-broker", daemon=True)
+            _broker_thread.start()
+        _subscribers.add(subscriber)
+    return subscriber
+
+
+def unsubscribe_from_logs(subscriber):
+    """Stop delivering log entries to `subscriber`."""
+    with _subscribers_lock:
+        _subscribers.discard(subscriber)
 
 
 def create_stream_blueprint(training_manager, app_logger):
@@ -15,7 +93,7 @@ def create_stream_blueprint(training_manager, app_logger):
     :return: Stream blueprint.
     """
     # Create a new logger for this blueprint
-    logger = app_logger.__class__("stream_routes")  # Create a scoped logger
+    logger = app_logger.for_name("stream_routes")  # Create a scoped logger
 
     stream_blueprint = Blueprint("stream_routes", __name__)
 
@@ -23,15 +101,27 @@ def create_stream_blueprint(training_manager, app_logger):
     def stream_logs():
         """Stream logs to the dashboard using server-sent events."""
         def generate():
-            while True:
-                try:
-                    log_entry = log_queue.get(timeout=1)
-                    yield f"data: {log_entry}\n\n"
-                except queue.Empty:
-                    continue
+            # Subscribed only once iteration starts, so the finally below always unsubscribes
+            subscriber = subscribe_to_logs()
+            try:
+                while True:
+                    try:
+                        batch = [subscriber.get(timeout=SSE_KEEPALIVE_INTERVAL)]
+                    except queue.Empty:
+                        yield SSE_KEEPALIVE_FRAME
+                        continue
+                    # Drain whatever else is already queued so a burst goes out in one send
+                    while len(batch) < SSE_MAX_BATCH:
+                        try:
+                            batch.append(subscriber.get_nowait())
+                        except queue.Empty:
+                            break
+                    yield b"".join(batch)
+            finally:
+                unsubscribe_from_logs(subscriber)
 
         logger.debug("Starting log streaming")
-        return Response(generate(), mimetype="text/event-stream")
+        return Response(generate(), mimetype="text/event-stream", direct_passthrough=True)
 
     @stream_blueprint.route("/video_feed")
     def video_feed():
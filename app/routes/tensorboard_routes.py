@@ -1,11 +1,29 @@
 # path: routes/tensorboard_routes.py
 
 from flask import Blueprint, jsonify, render_template
-import subprocess
+import functools
 import os
 import sys
-from pathlib import Path
-import threading
+
+# Arguments passed to TensorBoard after --logdir
+TENSORBOARD_ARGS = ("--port", "6006", "--bind_all")
+
+
+@functools.lru_cache(maxsize=None)
+def find_tensorboard_executable():
+    """
+    Locate the TensorBoard executable in the running interpreter's environment.
+    Only a successful lookup is cached, so a missing install is re-checked on the next call.
+
+    :return: Path to the TensorBoard executable.
+    """
+    from pathlib import Path
+
+    venv_dir = Path(sys.executable).parent
+    tensorboard_executable = venv_dir / ("tensorboard.exe" if os.name == "nt" else "tensorboard")
+    if not tensorboard_executable.is_file():
+        raise FileNotFoundError(f"TensorBoard executable not found at {tensorboard_executable}")
+    return tensorboard_executable
 
 
 def create_tensorboard_blueprint(training_manager, app_logger):
@@ -17,10 +35,15 @@ def create_tensorboard_blueprint(training_manager, app_logger):
     :return: TensorBoard blueprint.
     """
     # Create a scoped logger for this blueprint
-    logger = app_logger.__class__("tensorboard_routes")
+    logger = app_logger.for_name("tensorboard_routes")
 
     tensorboard_blueprint = Blueprint("tensorboard", __name__, url_prefix="/tensorboard")
 
+    # Compile the TensorBoard template when the blueprint is registered
+    @tensorboard_blueprint.record_once
+    def warm_templates(state):
+        state.app.jinja_env.get_template("tensorboard.html")
+
     # Shared state for TensorBoard
     tensorboard_process = None
 
@@ -30,17 +53,19 @@ def create_tensorboard_blueprint(training_manager, app_logger):
         """
         nonlocal tensorboard_process
         if tensorboard_process is None or tensorboard_process.poll() is not None:
-            try:
-                venv_dir = Path(sys.executable).parent
-                tensorboard_executable = venv_dir / "tensorboard.exe" if os.name == "nt" else venv_dir / "tensorboard"
+            # Only needed when a TensorBoard process is actually launched
+            import subprocess
 
-                if not tensorboard_executable.is_file():
-                    raise FileNotFoundError(f"TensorBoard executable not found at {tensorboard_executable}")
+            try:
+                tensorboard_executable = find_tensorboard_executable()
 
+                # Nothing reads TensorBoard's output; a pipe would eventually fill and stall it
                 tensorboard_process = subprocess.Popen(
-                    [str(tensorboard_executable), "--logdir", logdir, "--port", "6006", "--bind_all"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
+                    [str(tensorboard_executable), "--logdir", logdir, *TENSORBOARD_ARGS],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True,
+                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
                 )
                 logger.debug(f"TensorBoard started with executable: {tensorboard_executable}")
             except FileNotFoundError as e:
@@ -1,10 +1,48 @@
 # path: routes/training_routes.py
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 import threading
+import time
+import zlib
 
 enable_crt_shader = False
 
+# Seconds a polled status value is reused before it is checked again
+STATUS_CACHE_TTL = 0.2
+
+# Pre-serialized bodies for the boolean status endpoints
+TRAINING_STATUS_BODIES = {True: b'{"training":true}\n', False: b'{"training":false}\n'}
+RENDER_STATUS_BODIES = {True: b'{"rendering":true}\n', False: b'{"rendering":false}\n'}
+COMBINED_STATUS_BODIES = {
+    (training, rendering): (
+        b'{"training":' + (b"true" if training else b"false")
+        + b',"rendering":' + (b"true" if rendering else b"false") + b'}\n'
+    )
+    for training in (False, True)
+    for rendering in (False, True)
+}
+
+# Strong ETags for every status body, so an unchanged poll is answered with a bare 304
+STATUS_ETAGS = {
+    body: format(zlib.crc32(body), "08x")
+    for bodies in (TRAINING_STATUS_BODIES, RENDER_STATUS_BODIES, COMBINED_STATUS_BODIES)
+    for body in bodies.values()
+}
+
+
+def status_response(body):
+    """
+    Wrap a pre-serialized JSON body in a response, honouring If-None-Match.
+
+    :param body: One of the pre-serialized status bodies.
+    :return: A 200 response with the body, or a 304 when the client already has it.
+    """
+    response = Response(body, mimetype="application/json")
+    response.set_etag(STATUS_ETAGS[body])
+    # Let the browser keep the last body but revalidate it on every poll
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
 
 def create_training_blueprint(training_manager, app_logger, db_manager):
     """
@@ -16,7 +54,7 @@ def create_training_blueprint(training_manager, app_logger, db_manager):
     :return: Training blueprint.
     """
     # Scoped logger
-    logger = app_logger.__class__("training_routes")
+    logger = app_logger.for_name("training_routes")
 
     # Pass db_manager to training_manager
     training_manager.db_manager = db_manager
@@ -27,6 +65,29 @@ def create_training_blueprint(training_manager, app_logger, db_manager):
     training_thread = None
     training_lock = threading.Lock()  # Ensure thread-safe access to training_manager
 
+    # Bound once here so polled handlers skip the attribute lookups on every request
+    is_training_active = training_manager.is_training_active
+    is_model_updated = training_manager.is_model_updated
+
+    # Recently checked status values, keyed by name: (checked_at, value)
+    status_cache = {}
+
+    def cached_status(key, check, ttl=STATUS_CACHE_TTL):
+        """Return the result of `check()`, reusing it for `ttl` seconds across polls."""
+        now = time.monotonic()
+        entry = status_cache.get(key)
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        value = check()
+        status_cache[key] = (now, value)
+        return value
+
+    def check_rendering():
+        """Return whether the render manager is currently rendering."""
+        # The render manager is created by initialize_training, so it cannot be bound up front
+        render_manager = training_manager.render_manager
+        return bool(render_manager and render_manager.is_rendering())
+
     def serialize_config(config):
         """Prepare the configuration dictionary for JSON serialization."""
         def safe_serialize(value):
@@ -51,7 +112,7 @@ def create_training_blueprint(training_manager, app_logger, db_manager):
         nonlocal training_thread
 
         with training_lock:
-            if training_manager.is_training_active():
+            if is_training_active():
                 return jsonify({"status": "running", "message": "Training is already in progress."})
 
             data = request.get_json() or {}
@@ -84,6 +145,7 @@ def create_training_blueprint(training_manager, app_logger, db_manager):
 
         training_thread = threading.Thread(target=run_training, daemon=True)
         training_thread.start()
+        status_cache.clear()
 
         return jsonify({
             "status": "success",
@@ -95,11 +157,12 @@ def create_training_blueprint(training_manager, app_logger, db_manager):
     def stop_training():
         """Stop the training process."""
         with training_lock:
-            if not training_manager.is_training_active():
+            if not is_training_active():
                 return jsonify({"status": "not_running", "message": "Training is not running."})
 
             try:
                 training_manager.stop_training()
+                status_cache.clear()
                 logger.info("Training stop command executed.")
                 return jsonify({"status": "success", "message": "Training stopped successfully."})
             except Exception as e:
@@ -109,27 +172,39 @@ def create_training_blueprint(training_manager, app_logger, db_manager):
     @training_blueprint.route("/training_status", methods=["GET"]) 
     def training_status():
         """Return the current training status."""
-        with training_lock:
-            try:
-                training_active = training_manager.is_training_active()
-                logger.debug(f"Training status checked: active={training_active}")
-                return jsonify({"training": training_active})
-            except Exception as e:
-                logger.error(f"Error checking training status: {e}") 
-                return jsonify({"status": "error", "message": "Failed to check training status."}), 500
+        # Reads a threading.Event on the manager, so polls never wait on training_lock
+        try:
+            training_active = cached_status("training", is_training_active)
+            logger.debug(f"Training status checked: active={training_active}")
+            return status_response(TRAINING_STATUS_BODIES[bool(training_active)])
+        except Exception as e:
+            logger.error(f"Error checking training status: {e}") 
+            return jsonify({"status": "error", "message": "Failed to check training status."}), 500
 
     @training_blueprint.route("/render_status", methods=["GET"])
     def render_status():
         """Check if rendering is active."""
-        with training_lock:
-            try:
-                rendering = training_manager.render_manager.is_rendering() if training_manager.render_manager else False
-                logger.debug(f"Render status checked: rendering={rendering}")
-                return jsonify({"rendering": rendering})
-            except Exception as e:
-                logger.error(f"Error checking render status: {e}")
-                return jsonify({"status": "error", "message": "Failed to check rendering status."}), 500
+        # is_rendering only reads an Event, so polls never wait on training_lock
+        try:
+            rendering = cached_status("rendering", check_rendering)
+            logger.debug(f"Render status checked: rendering={rendering}")
+            return status_response(RENDER_STATUS_BODIES[rendering])
+        except Exception as e:
+            logger.error(f"Error checking render status: {e}")
+            return jsonify({"status": "error", "message": "Failed to check rendering status."}), 500
             
+    @training_blueprint.route("/status", methods=["GET"])
+    def status():
+        """Return the training and rendering status in a single poll."""
+        try:
+            training_active = cached_status("training", is_training_active)
+            rendering = cached_status("rendering", check_rendering)
+            logger.debug(f"Status checked: training={training_active}, rendering={rendering}")
+            return status_response(COMBINED_STATUS_BODIES[bool(training_active), rendering])
+        except Exception as e:
+            logger.error(f"Error checking status: {e}")
+            return jsonify({"status": "error", "message": "Failed to check status."}), 500
+
     @training_blueprint.route('/shader_status', methods=['GET'])
     def shader_status():
         """Return current shader settings."""
@@ -177,14 +252,13 @@ def create_training_blueprint(training_manager, app_logger, db_manager):
     @training_blueprint.route("/model_status", methods=["GET"])
     def model_status():
         """Check if the model has been updated."""
-        with training_lock:
-            try:
-                model_updated = training_manager.is_model_updated()
-                logger.debug(f"Model status checked: updated={model_updated}")
-                return jsonify({"model_updated": model_updated})
-            except Exception as e:
-                logger.error(f"Error checking model status: {e}")
-                return jsonify({"status": "error", "message": "Failed to check model status."}), 500
+        try:
+            model_updated = is_model_updated()
+            logger.debug(f"Model status checked: updated={model_updated}")
+            return jsonify({"model_updated": model_updated})
+        except Exception as e:
+            logger.error(f"Error checking model status: {e}")
+            return jsonify({"status": "error", "message": "Failed to check model status."}), 500
             
     @training_blueprint.route("/current_config", methods=["GET"])
     def get_current_config():
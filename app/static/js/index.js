@@ -44,7 +44,7 @@ function initializeHeaderControls() {
             if (response.ok) {
                 alert(result.message || "Training started successfully!");
                 updateStatus(true, false);
-                pollRenderStatus();
+                pollRenderStatus(true);
             } else {
                 console.error(result.message);
                 alert(`Error: ${result.message}`);
@@ -73,34 +73,24 @@ function initializeHeaderControls() {
         }
     };
 
-    // Poll rendering status
-    const pollRenderStatus = async () => {
+    // Poll training and rendering status in one request until rendering starts
+    const pollRenderStatus = async (awaitingStart = false) => {
         try {
-            const response = await fetch("/training/render_status");
-            const { rendering } = await response.json();
-            updateStatus(true, rendering);
-            if (!rendering) setTimeout(pollRenderStatus, 3000);
+            const response = await fetch("/training/status");
+            const { training, rendering } = await response.json();
+            // Training initializes in the background, so keep waiting until it reports in
+            const pending = awaitingStart && !training;
+            updateStatus(training || pending, rendering);
+            if ((training || pending) && !rendering) setTimeout(() => pollRenderStatus(pending), 3000);
         } catch (error) {
-            console.error("Error polling render status:", error);
-        }
-    };
-
-    // Poll training status
-    const pollTrainingStatus = async () => {
-        try {
-            const response = await fetch("/training/training_status");
-            const { training } = await response.json();
-            updateStatus(training, false);
-        } catch (error) {
-            console.error("Error polling training status:", error);
-            updateStatus(false, false);
+            console.error("Error polling status:", error);
         }
     };
 
     // Initial status checks
     (async () => {
         updateStatus(false, false);
-        await pollTrainingStatus();
+        await pollRenderStatus();
     })();
 }
 
@@ -3,18 +3,44 @@
 from gui import DEFAULT_TRAINING_CONFIG, DEFAULT_HYPERPARAMETERS
 from render_manager import RenderManager
 from log_manager import LogManager
-from utils import create_env, linear_schedule, load_blueprints as Blueprint
-from stable_baselines3 import PPO
-from stable_baselines3.common.vec_env import SubprocVecEnv, VecMonitor
+from utils import create_env, resolve_wrappers, linear_schedule, load_blueprints as Blueprint
+from stable_baselines3.common.vec_env import DummyVecEnv, VecMonitor
 from stable_baselines3.common.callbacks import CallbackList
 from preprocessing import MarioFeatureExtractor
+from overlap_ppo import OverlappedPPO
+from vec_env import ShmemVecEnv
+from types import MappingProxyType
+from collections import ChainMap
+import ast
+import functools
+import re
 import threading
+import torch
 import importlib
-import inspect
 
 
 logger = LogManager("TrainingManager")
 
+# Form values that should become int or float
+_NUM_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)$")
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_stages(stages):
+    """
+    Parse a stages string, either a list literal or comma-separated names.
+
+    :param stages: e.g. "1-1, 1-2" or "['1-1', '1-2']".
+    :return: Tuple of stage names.
+    """
+    if stages.lstrip().startswith("["):
+        try:
+            return tuple(str(stage).strip() for stage in ast.literal_eval(stages))
+        except (ValueError, SyntaxError):
+            logger.warning(f"Could not parse stages list: {stages}")
+            return ()
+    return tuple(stage.strip() for stage in stages.split(",") if stage.strip())
+
 
 class TrainingManager:
     def __init__(self, config=None, db_manager=None):
@@ -46,13 +72,13 @@ class TrainingManager:
         self.training_active_event.clear()
         self.model_updated_flag = threading.Event()
         self.model_updated_flag.clear()
+        self.frame_tick = threading.Event()  # Set by RenderCallback as the training loop steps
         self.render_manager = None
         self.model = None
         self.env = None
-        self.wrapper_blueprints = {}
-        self.callback_blueprints = {}
         self.callback_instances = []
         self.selected_wrappers = []
+        self.wrapper_index = {}
         self.shader_settings = {
             "radial_distortion": False,
             "scanlines": False,
@@ -125,20 +151,32 @@ class TrainingManager:
             "enabled_callbacks": required_callbacks,
         }
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _scan_blueprints(module_name):
+        """
+        Scan a module for blueprints once; later calls share a read-only view.
+        Blueprints are ordered by name, which is the order wrappers get applied in.
+        """
+        module = importlib.import_module(module_name)
+        blueprints = {
+            name: obj for name, obj in sorted(vars(module).items())
+            if type(obj) is Blueprint
+        }
+        logger.info(f"Loaded blueprints from {module_name}: {list(blueprints.keys())}")
+        return MappingProxyType(blueprints)
+
     @staticmethod
     def load_blueprints(module_name):
-        """Dynamically load all blueprints from a given module."""
+        """
+        Dynamically load all blueprints from a given module.
+        Failures are not cached, so a later call retries the import.
+        """
         try:
-            module = importlib.import_module(module_name)
-            blueprints = {
-                name: obj for name, obj in inspect.getmembers(module)
-                if isinstance(obj, Blueprint)
-            }
-            logger.info(f"Loaded blueprints from {module_name}: {list(blueprints.keys())}")
-            return blueprints
+            return TrainingManager._scan_blueprints(module_name)
         except Exception as e:
             logger.error(f"Error loading blueprints from {module_name}: {e}")
-            return {}
+            return MappingProxyType({})
 
     def stop_training(self):
         """Stop training and rendering gracefully."""
@@ -148,6 +186,16 @@ class TrainingManager:
             self.render_manager.stop()
         logger.info("Training stopped.")
 
+    def _close_env(self):
+        """Close the training env, releasing its worker processes and shared memory segments."""
+        if self.env is None:
+            return
+        try:
+            self.env.close()
+        except Exception as e:
+            logger.error("Error closing training environment.", exception=e)
+        self.env = None
+
     def is_training_active(self):
         """Check if training is active."""
         return self.training_active_event.is_set()
@@ -175,6 +223,9 @@ class TrainingManager:
         logger.debug(f"Loaded wrapper blueprints: {list(self.wrapper_blueprints.keys())}")
         logger.debug(f"Loaded callback blueprints: {list(self.callback_blueprints.keys())}")
 
+        # Release the previous run's workers and shared memory before building new ones
+        self._close_env()
+
         # Load the active configuration
         self.config = self.get_active_config()
 
@@ -193,7 +244,8 @@ class TrainingManager:
             model=self.model,
             training_active_flag=self.is_training_active,
             model_updated_flag=self.model_updated_flag,
-            shader_settings_flag=lambda: self.shader_settings  # Dynamically fetch shader states
+            shader_settings_flag=lambda: self.shader_settings,  # Dynamically fetch shader states
+            frame_tick=self.frame_tick,
         )
 
     def update_config(self, new_config):
@@ -221,6 +273,8 @@ class TrainingManager:
         """Merge and parse user-provided configurations."""
         default_config = {
             "num_envs": 1,
+            "num_render_envs": 1,
+            "n_envs_per_process": None,  # None spreads the environments over the available CPUs
             "stages": [],
             "random_stages": False,  # Default to False
             "total_timesteps": 32000000,
@@ -264,23 +318,26 @@ class TrainingManager:
         enabled_wrappers = self.config.get("enabled_wrappers", [])
         enabled_callbacks = self.config.get("enabled_callbacks", [])
 
-        # Parse stages input to convert from comma-separated string
+        # Parse stages input to convert from a comma-separated or list-literal string
         stages = training_config.get("stages", [])
         if isinstance(stages, str):  # Convert string to a list
-            stages = [stage.strip() for stage in stages.split(",") if stage.strip()]
+            stages = list(_parse_stages(stages))
         training_config["stages"] = stages
 
-        # Parse and merge configurations
-        for key, value in {**training_config, **hyperparameters}.items():
-            if value in ("None", None, ""):  # Handle None and empty strings
-                training_config[key] = None
-                hyperparameters[key] = None
-            elif isinstance(value, str) and value.replace(".", "", 1).isdigit():
-                training_config[key] = float(value) if "." in value else int(value)
-                hyperparameters[key] = float(value) if "." in value else int(value)
+        # Parse numeric and empty values in place in each section
+        for section in (training_config, hyperparameters):
+            for key, value in section.items():
+                if value in ("None", None, ""):  # Handle None and empty strings
+                    section[key] = None
+                elif isinstance(value, str) and _NUM_RE.match(value):
+                    section[key] = float(value) if "." in value else int(value)
 
-        default_config.update(training_config)
-        default_config.update(hyperparameters)
+        # Layer the sections over the defaults (hyperparameters win) and materialize once
+        default_config = dict(ChainMap(hyperparameters, training_config, default_config))
+
+        # Resolve "auto" up front so the model, rollout staging and render cache agree on the device
+        if default_config.get("device") in (None, "auto"):
+            default_config["device"] = "cuda" if torch.cuda.is_available() else "cpu"
 
         # Add dynamic schedules
         default_config["learning_rate"] = linear_schedule(
@@ -342,6 +399,12 @@ class TrainingManager:
             else:
                 logger.warning(f"Wrapper '{blueprint.name}' not selected or not required. Skipping.")
 
+        # Blueprints keyed by both their display name and class name for O(1) lookup in resolve_wrappers
+        self.wrapper_index = {}
+        for blueprint in self.wrapper_blueprints.values():
+            self.wrapper_index[blueprint.name] = blueprint
+            self.wrapper_index[blueprint.component_class.__name__] = blueprint
+
         logger.debug(f"Final selected wrappers: {self.selected_wrappers}")
         logger.debug(f"Final selected callbacks: {[callback.__class__.__name__ for callback in self.callback_instances]}")
 
@@ -351,23 +414,35 @@ class TrainingManager:
     def _initialize_environments_and_model(self):
         """Initialize the environment and the model."""
         try:
-            # Pass db_manager when creating the render environment
+            # Resolve the selected wrappers once; every environment factory shares the result
+            wrappers_order = resolve_wrappers(
+                selected_wrappers=self.selected_wrappers,
+                blueprint_index=self.wrapper_index,
+                db_manager=self.db_manager,  # Pass db_manager here
+            )
+
+            # Render environments are batched so the render loop runs a single policy
+            # forward pass per logic tick
+            num_render_envs = int(self.config["num_render_envs"])
             if self.config["random_stages"] == "True":
-                self.render_env = create_env(
-                    random_stages=self.config["random_stages"],
-                    stages=self.config["stages"],
-                    env_index=0,
-                    selected_wrappers=self.selected_wrappers,
-                    blueprints=self.wrapper_blueprints,
-                    db_manager=self.db_manager  # Pass db_manager here
-                )()
+                render_env_fns = [
+                    create_env(
+                        random_stages=self.config["random_stages"],
+                        stages=self.config["stages"],
+                        env_index=0,
+                        wrappers_order=wrappers_order,
+                    )
+                    for _ in range(num_render_envs)
+                ]
             else:
-                self.render_env = create_env(
-                    env_index=0,
-                    selected_wrappers=self.selected_wrappers,
-                    blueprints=self.wrapper_blueprints,
-                    db_manager=self.db_manager  # Pass db_manager here
-                )()
+                render_env_fns = [
+                    create_env(
+                        env_index=0,
+                        wrappers_order=wrappers_order,
+                    )
+                    for _ in range(num_render_envs)
+                ]
+            self.render_env = DummyVecEnv(render_env_fns)
 
             # Create training environments
             num_envs = int(self.config["num_envs"])
@@ -377,9 +452,7 @@ class TrainingManager:
                         random_stages=self.config["random_stages"],
                         stages=self.config["stages"],
                         env_index=i + 1,
-                        selected_wrappers=self.selected_wrappers,
-                        blueprints=self.wrapper_blueprints,
-                        db_manager=self.db_manager  # Pass db_manager here
+                        wrappers_order=wrappers_order,
                     )
                     for i in range(num_envs)
                 ]
@@ -387,16 +460,17 @@ class TrainingManager:
                 env_fns = [
                     create_env(
                         env_index=i + 1,
-                        selected_wrappers=self.selected_wrappers,
-                        blueprints=self.wrapper_blueprints,
-                        db_manager=self.db_manager  # Pass db_manager here
+                        wrappers_order=wrappers_order,
                     )
                     for i in range(num_envs)
                 ]
-            self.env = VecMonitor(SubprocVecEnv(env_fns))
+            # Observations come back through shared memory instead of being pickled over pipes
+            self.env = VecMonitor(
+                ShmemVecEnv(env_fns, n_envs_per_process=self.config["n_envs_per_process"])
+            )
 
-            # Create PPO model
-            self.model = PPO(
+            # Create PPO model; rollouts overlap inference on one half of the workers with the other's step
+            self.model = OverlappedPPO(
                 "MultiInputPolicy",
                 self.env,
                 verbose=1,
@@ -437,3 +511,5 @@ class TrainingManager:
             logger.error(f"An error occurred during training: {e}")
         finally:
             self.stop_training()
+            # learn has returned, so nothing is stepping the env anymore
+            self._close_env()
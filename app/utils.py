@@ -3,9 +3,10 @@
 import gym_super_mario_bros
 from log_manager import LogManager
 import time
+import functools
 from abc import ABC
 from inspect import signature
-from preprocessing import MaxAndSkipEnv, MarioRescale84x84, PixelNormalization, ImageToPyTorch
+from preprocessing import MaxAndSkipEnv, MarioRescale84x84, ImageToPyTorch
 from gym_super_mario_bros.actions import COMPLEX_MOVEMENT
 from nes_py.wrappers import JoypadSpace
 
@@ -38,11 +39,22 @@ class load_blueprints(ABC):
         self.arg_map = arg_map or {}
         self.name = name or component_class.__name__
         self.description = description or "No description provided."
+        # Constructor parameter names, introspected once per blueprint
+        self._sig_params = frozenset(signature(component_class).parameters)
 
     def is_required(self):
         """Check if the blueprint is required."""
         return self.required
 
+    def valid_params(self, params):
+        """
+        Keep only the parameters accepted by the component's constructor.
+
+        :param params: Candidate keyword arguments.
+        :return: The subset of `params` the component accepts.
+        """
+        return {k: v for k, v in params.items() if k in self._sig_params}
+
     def create_instance(self, config=None, env=None, **override_params):
         """
         Create an instance of the component with optional parameter overrides.
@@ -63,18 +75,19 @@ class load_blueprints(ABC):
 
         # Add the `env` argument for wrappers
         if self.component_type == "wrapper":
-            logger.debug(f"Checking env argument for wrapper {self.name}")
+            if logger.is_debug_enabled():
+                logger.debug(f"Checking env argument for wrapper {self.name}")
             if env is None:
                 logger.error(f"The 'env' argument is missing for wrapper {self.name}.")
                 raise ValueError(f"The 'env' argument is required for wrapper {self.name}.")
             params["env"] = env
 
         # Validate arguments against the component's signature
-        component_sig = signature(self.component_class)
-        valid_params = {k: v for k, v in params.items() if k in component_sig.parameters}
+        valid_params = self.valid_params(params)
 
         # Debug: Log final parameters passed to the component
-        logger.debug(f"Creating {self.component_class.__name__} with parameters: {valid_params}")
+        if logger.is_debug_enabled():
+            logger.debug(f"Creating {self.component_class.__name__} with parameters: {valid_params}")
         return self.component_class(**valid_params)
 
 
@@ -101,18 +114,77 @@ def create_mario_env(env, wrappers_order):
                 env = wrapper_func(env, *args, **kwargs)
     return env
 
-def create_env(random_stages=False, stages=None, env_index=1, selected_wrappers=None, blueprints=None, db_manager=None):
+
+# Wrappers every environment gets, applied before the selected blueprint wrappers
+BASE_WRAPPERS = (
+    (JoypadSpace, [COMPLEX_MOVEMENT], {}),
+    (MaxAndSkipEnv, [], {}),
+    (MarioRescale84x84, [], {}),
+)
+
+
+def resolve_wrappers(selected_wrappers=None, blueprint_index=None, db_manager=None):
+    """
+    Resolve the selected wrapper names to the wrappers applied to every environment.
+    Runs once in the parent process so each worker only receives the final list.
+
+    :param selected_wrappers: Names of the selected wrappers, in application order.
+    :param blueprint_index: Wrapper blueprints keyed by both blueprint name and class name.
+    :param db_manager: Database manager passed to wrappers that map it.
+    :return: List of (blueprint, kwargs) tuples.
+    """
+    wrappers_order = []
+    if not selected_wrappers or not blueprint_index:
+        return wrappers_order
+
+    for wrapper_name in dict.fromkeys(selected_wrappers):  # Drop duplicates, keep order
+        blueprint = blueprint_index.get(wrapper_name)
+        if not blueprint:
+            logger.warning(f"Wrapper {wrapper_name} not found in blueprints. Skipping.")
+            continue
+        # Checked here once instead of on every wrapper instantiation in the workers
+        if blueprint.component_type != "wrapper" or not blueprint.valid_params({"env": None}):
+            logger.warning(f"Blueprint {blueprint.name} does not take an 'env' argument. Skipping.")
+            continue
+        wrapper_kwargs = dict(blueprint.default_params)
+        if "db_manager" in blueprint.arg_map:
+            wrapper_kwargs["db_manager"] = db_manager
+        wrappers_order.append((blueprint, wrapper_kwargs))
+        logger.info(f"Wrapper {blueprint.name} added to the order.")
+    return wrappers_order
+
+
+def build_wrapper_spec(wrappers_order, env_index):
+    """
+    Build the complete wrapper spec for one environment, with every argument bound.
+
+    :param wrappers_order: Selected wrappers as returned by resolve_wrappers.
+    :param env_index: Index of the environment, passed to wrappers that accept it.
+    :return: Tuple of (wrapper class, args, kwargs), applied in order to the base environment.
+    """
+    spec = list(BASE_WRAPPERS)
+    for blueprint, kwargs in wrappers_order:
+        spec.append((blueprint.component_class, (), blueprint.valid_params({**kwargs, "env_index": env_index})))
+    return tuple(spec)
+
+
+def create_env(wrappers_order=None, env_index=1, random_stages=False, stages=None):
     """
     Creates and wraps the Super Mario environment with dynamic wrapper application.
+
+    :param wrappers_order: Selected wrappers as returned by resolve_wrappers.
+    :param env_index: Index of the environment, passed to each selected wrapper.
+    :param random_stages: Whether to sample stages at random.
+    :param stages: Stages to sample from when random_stages is set.
+    :return: A factory that builds the wrapped environment.
     """
+    # Resolved in the calling process; the worker only applies the finished spec
+    wrapper_spec = build_wrapper_spec(wrappers_order or [], env_index)
+
     def _init():
-        env_logger = LogManager(f"env_{env_index}")
+        env_logger = LogManager.for_name(f"env_{env_index}")
         env_logger.info(f"Initializing environment {env_index}")
 
-        # Debug: Log selected wrappers and blueprints
-        env_logger.debug(f"Selected wrappers: {selected_wrappers}")
-        env_logger.debug(f"Available blueprints: {list(blueprints.keys())}")
-
         # Create base environment
         if random_stages:
             env = gym_super_mario_bros.make("SuperMarioBrosRandomStages-v0", stages=stages)
@@ -121,32 +193,8 @@ def create_env(random_stages=False, stages=None, env_index=1, selected_wrappers=
             env = gym_super_mario_bros.make("SuperMarioBros-v0")
             env_logger.info("Base environment created without random stages.")
 
-        # Process dynamically selected wrappers
-        wrappers_order = [
-            (JoypadSpace, [COMPLEX_MOVEMENT], {}),
-            (MaxAndSkipEnv, [], {}),
-            (MarioRescale84x84, [], {}),
-        ]
-        
-        if selected_wrappers and blueprints:
-            for wrapper_name in selected_wrappers:
-                env_logger.debug(f"Processing wrapper: {wrapper_name}")
-                blueprint = next(
-                    (bp for bp in blueprints.values()
-                     if bp.name == wrapper_name or bp.component_class.__name__ == wrapper_name),
-                    None,
-                )
-                if blueprint:
-                    wrapper_kwargs = {"env_index": env_index}
-                    if "db_manager" in blueprint.arg_map:
-                        wrapper_kwargs["db_manager"] = db_manager
-                    wrappers_order.append((blueprint.component_class, [], wrapper_kwargs))
-                    env_logger.info(f"Wrapper {blueprint.name} added to the order.")
-                else:
-                    env_logger.warning(f"Wrapper {wrapper_name} not found in blueprints. Skipping.")
-
         # Apply wrappers
-        for wrapper_class, args, kwargs in wrappers_order:
+        for wrapper_class, args, kwargs in wrapper_spec:
             env = wrapper_class(env, *args, **kwargs)
 
         env_logger.info(f"Environment {env_index} initialized successfully with all wrappers.")
@@ -154,6 +202,11 @@ def create_env(random_stages=False, stages=None, env_index=1, selected_wrappers=
 
     return _init
 
+def _linear_value(final_value, span, progress):
+    """Value of a linear schedule at `progress` (1.0 at the start of training, 0.0 at the end)."""
+    return final_value + progress * span
+
+
 def linear_schedule(initial_value, final_value=0.0):
     """
     Linear learning rate schedule.
@@ -163,15 +216,11 @@ def linear_schedule(initial_value, final_value=0.0):
     :return: A function to compute the parameter value based on progress.
     """
     if isinstance(initial_value, str):
-        initial_value = float(initial_value)
-        final_value = float(final_value)
-        assert initial_value > 0.0, "linear_schedule works only with positive decreasing values"
-
-    def func(progress):
-        value = final_value + progress * (initial_value - final_value)
-        # logger.debug("Linear schedule computed", initial=initial_value, final=final_value, progress=progress, value=value)
-        return value
+        assert float(initial_value) > 0.0, "linear_schedule works only with positive decreasing values"
+    initial_value = float(initial_value)
+    final_value = float(final_value)
 
-    return func
+    # The span is computed once; PPO evaluates the schedule on every optimizer update
+    return functools.partial(_linear_value, final_value, initial_value - final_value)
 
 
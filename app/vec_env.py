@@ -0,0 +1,366 @@
+# path: ./vec_env.py
+
+import math
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import os
+import numpy as np
+from stable_baselines3.common.env_util import is_wrapped
+from stable_baselines3.common.vec_env.base_vec_env import CloudpickleWrapper, VecEnv
+from stable_baselines3.common.vec_env.util import dict_to_obs, obs_space_info
+from log_manager import LogManager
+
+logger = LogManager("vec_env")
+
+# Imported once by the forkserver so every forked worker starts with them loaded
+FORKSERVER_PRELOAD = ["numpy", "cv2", "gym_super_mario_bros", "nes_py.wrappers", "preprocessing"]
+
+
+def _attach_buffers(buffer_specs):
+    """
+    Map the parent's shared observation buffers into this process.
+
+    :param buffer_specs: List of (key, shared memory name, shape, dtype) tuples.
+    :return: The open SharedMemory handles and a dict of key -> ndarray view.
+    """
+    handles = []
+    views = {}
+    for key, name, shape, dtype in buffer_specs:
+        shm = shared_memory.SharedMemory(name=name)
+        handles.append(shm)
+        views[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    return handles, views
+
+
+def _write_obs(views, index, obs):
+    """Copy one environment's observation into its row of the shared buffers."""
+    for key, view in views.items():
+        view[index] = obs if key is None else obs[key]
+
+
+def _worker(remote, parent_remote, env_fns_wrapper, start):
+    """
+    Subprocess loop: step a group of environments in series, reading actions from and
+    writing observations, rewards and dones to shared memory.
+
+    :param remote: Worker end of the command pipe.
+    :param parent_remote: Parent end of the pipe, closed in the worker.
+    :param env_fns_wrapper: CloudpickleWrapper around this worker's environment factories.
+    :param start: Row of the shared buffers owned by the worker's first environment.
+    """
+    parent_remote.close()
+    envs = [env_fn() for env_fn in env_fns_wrapper.var]
+    handles, views, step_views = [], {}, {}
+    while True:
+        try:
+            cmd, data = remote.recv()
+            if cmd == "step":
+                actions, rewards, dones = step_views["actions"], step_views["rewards"], step_views["dones"]
+                infos = []
+                for row, env in enumerate(envs, start):
+                    observation, reward, done, info = env.step(actions[row].copy())
+                    if done:
+                        # Terminal observations only occur at episode ends, so they still go over the pipe
+                        info["terminal_observation"] = observation
+                        observation = env.reset()
+                    _write_obs(views, row, observation)
+                    rewards[row] = reward
+                    dones[row] = done
+                    infos.append(info)
+                remote.send(infos)
+            elif cmd == "reset":
+                for offset, env in enumerate(envs):
+                    _write_obs(views, start + offset, env.reset())
+                remote.send(None)
+            elif cmd == "attach":
+                handles, views = _attach_buffers(data[0])
+                step_handles, step_views = _attach_buffers(data[1])
+                handles += step_handles
+                remote.send(None)
+            elif cmd == "seed":
+                remote.send([env.seed(seed) for env, seed in zip(envs, data)])
+            elif cmd == "render":
+                remote.send([env.render(data) for env in envs])
+            elif cmd == "close":
+                for env in envs:
+                    env.close()
+                # Views must be released before their segments can be closed
+                views, step_views = {}, {}
+                for shm in handles:
+                    shm.close()
+                remote.close()
+                break
+            elif cmd == "get_spaces":
+                remote.send((envs[0].observation_space, envs[0].action_space))
+            elif cmd == "env_method":
+                local_indices, (name, args, kwargs) = data
+                remote.send([getattr(envs[i], name)(*args, **kwargs) for i in local_indices])
+            elif cmd == "get_attr":
+                local_indices, name = data
+                remote.send([getattr(envs[i], name) for i in local_indices])
+            elif cmd == "set_attr":
+                local_indices, (name, value) = data
+                remote.send([setattr(envs[i], name, value) for i in local_indices])
+            elif cmd == "is_wrapped":
+                local_indices, wrapper_class = data
+                remote.send([is_wrapped(envs[i], wrapper_class) for i in local_indices])
+            else:
+                raise NotImplementedError(f"`{cmd}` is not implemented in the worker")
+        except EOFError:
+            break
+
+
+class ShmemVecEnv(VecEnv):
+    """
+    Subprocess vectorized environment that returns observations through shared memory.
+
+    Behaves like SubprocVecEnv, but every worker writes its observations directly into a
+    shared (num_envs, *shape) array per observation key. Actions, rewards and dones are
+    exchanged through shared arrays as well; the pipes only carry a bare step command
+    and the per-env info dicts back.
+
+    Each worker process steps a contiguous group of environments in series, so one pipe
+    round trip covers the whole group and a slow environment only stalls its own group.
+
+    The workers are also split into two fixed halves that can be stepped separately with
+    step_group_async / step_group_wait, letting the caller run inference for one half
+    while the other is stepping. step_wait then returns the assembled full step.
+
+    :param env_fns: Environment factories.
+    :param start_method: multiprocessing start method; defaults to forkserver where available.
+    :param n_envs_per_process: Environments stepped by each worker; None spreads them over the CPUs.
+    """
+
+    def __init__(self, env_fns, start_method=None, n_envs_per_process=None):
+        self.closed = False
+        # Workers with a step in flight whose results have not been received yet
+        self._in_flight = set()
+        n_envs = len(env_fns)
+
+        if not n_envs_per_process:
+            n_procs = min(n_envs, os.cpu_count() or 1)
+            n_envs_per_process = math.ceil(n_envs / n_procs)
+        self.n_envs_per_process = int(n_envs_per_process)
+        groups = [
+            env_fns[start:start + self.n_envs_per_process]
+            for start in range(0, n_envs, self.n_envs_per_process)
+        ]
+
+        if start_method is None:
+            # forkserver is safer than fork with threads and faster than spawn
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        ctx = mp.get_context(start_method)
+        if start_method == "forkserver":
+            # Only takes effect before the forkserver is first started; unimportable names are skipped
+            ctx.set_forkserver_preload(FORKSERVER_PRELOAD)
+
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(len(groups))])
+        self.processes = []
+        for group_index, (work_remote, remote, group) in enumerate(zip(self.work_remotes, self.remotes, groups)):
+            args = (work_remote, remote, CloudpickleWrapper(group), group_index * self.n_envs_per_process)
+            # daemon=True: if the main process crashes, we should not cause things to hang
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        self.remotes[0].send(("get_spaces", None))
+        observation_space, action_space = self.remotes[0].recv()
+        VecEnv.__init__(self, n_envs, observation_space, action_space)
+
+        # One shared (num_envs, *shape) array per observation key, owned and unlinked by this process
+        self.keys, shapes, dtypes = obs_space_info(observation_space)
+        self._shms = []
+        obs_specs = []
+        self._buf_obs = {
+            key: self._allocate_shared(obs_specs, key, (n_envs,) + tuple(shapes[key]), dtypes[key])
+            for key in self.keys
+        }
+        step_specs = []
+        self._buf_actions = self._allocate_shared(
+            step_specs, "actions", (n_envs,) + tuple(action_space.shape), action_space.dtype
+        )
+        self._buf_rewards = self._allocate_shared(step_specs, "rewards", (n_envs,), np.float32)
+        self._buf_dones = self._allocate_shared(step_specs, "dones", (n_envs,), np.bool_)
+
+        for remote in self.remotes:
+            remote.send(("attach", (obs_specs, step_specs)))
+        for remote in self.remotes:
+            remote.recv()
+        # Two halves of the workers that can be stepped independently of each other
+        half = math.ceil(len(groups) / 2)
+        self.worker_groups = (range(0, half), range(half, len(groups)))
+        # Per-half results of the step being assembled; infos are swapped for a fresh list each step
+        self._group_infos = [None] * n_envs
+        self._group_obs = [None, None]
+        self._group_rewards = np.zeros(n_envs, dtype=np.float32)
+        self._group_dones = np.zeros(n_envs, dtype=np.bool_)
+
+        logger.info(
+            f"Started {len(groups)} shared-memory workers for {n_envs} environments "
+            f"({self.n_envs_per_process} per process, {start_method})."
+        )
+
+    def _allocate_shared(self, specs, key, shape, dtype):
+        """
+        Allocate a shared array owned by this process and record how workers can attach it.
+
+        :param specs: List collecting (key, shared memory name, shape, dtype) attach specs.
+        :param key: Name the workers look the array up by.
+        :param shape: Array shape.
+        :param dtype: Array dtype.
+        :return: The parent's view of the array.
+        """
+        dtype = np.dtype(dtype)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+        self._shms.append(shm)
+        specs.append((key, shm.name, shape, dtype.str))
+        return np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    def _obs_from_buf(self):
+        """Return a copy of the shared observations; workers overwrite them on the next step."""
+        return dict_to_obs(self.observation_space, {key: buf.copy() for key, buf in self._buf_obs.items()})
+
+    def _dispatch(self, cmd, payload, indices=None):
+        """
+        Send a per-environment command to the workers owning `indices`.
+
+        :param cmd: Worker command name.
+        :param payload: Command data shared by every selected environment.
+        :param indices: Environment indices to target; None targets all of them.
+        :return: The per-environment results, in the order of `indices`.
+        """
+        indices = list(self._get_indices(indices))
+        groups = {}
+        for index in indices:
+            worker, local_index = divmod(index, self.n_envs_per_process)
+            groups.setdefault(worker, []).append(local_index)
+        for worker, local_indices in groups.items():
+            self.remotes[worker].send((cmd, (local_indices, payload)))
+        results = {}
+        for worker, local_indices in groups.items():
+            for local_index, result in zip(local_indices, self.remotes[worker].recv()):
+                results[worker * self.n_envs_per_process + local_index] = result
+        return [results[index] for index in indices]
+
+    def _send_step(self, workers, actions, rows):
+        """Write `actions` into the shared action rows `rows` and tell `workers` to step."""
+        self._buf_actions[rows] = actions
+        for worker in workers:
+            self.remotes[worker].send(("step", None))
+            self._in_flight.add(worker)
+
+    def step_async(self, actions):
+        self._send_step(range(len(self.remotes)), actions, slice(None))
+
+    def step_wait(self):
+        if any(part is not None for part in self._group_obs):
+            # Both halves were stepped separately; hand back the step they assembled.
+            # Their next step may already be in flight, so it gets a fresh infos list.
+            infos, self._group_infos = self._group_infos, [None] * self.num_envs
+            group_obs, self._group_obs = self._group_obs, [None, None]
+            obs = dict_to_obs(
+                self.observation_space,
+                {key: np.concatenate([part[key] for part in group_obs]) for key in self._buf_obs},
+            )
+            return obs, self._group_rewards.copy(), self._group_dones.copy(), infos
+
+        infos = [info for remote in self.remotes for info in remote.recv()]
+        self._in_flight.clear()
+        # Copied, since the workers overwrite the shared rows on the next step
+        return self._obs_from_buf(), self._buf_rewards.copy(), self._buf_dones.copy(), infos
+
+    def env_group_slice(self, group):
+        """
+        Return the environment indices covered by one half of the workers.
+
+        :param group: Half of the workers, 0 or 1.
+        :return: A slice over the environment axis.
+        """
+        workers = self.worker_groups[group]
+        start = workers.start * self.n_envs_per_process
+        stop = min(workers.stop * self.n_envs_per_process, self.num_envs)
+        return slice(start, stop)
+
+    def step_group_async(self, group, actions):
+        """
+        Start a step on one half of the workers.
+
+        :param group: Half of the workers, 0 or 1.
+        :param actions: Actions for the environments in env_group_slice(group).
+        """
+        self._send_step(self.worker_groups[group], actions, self.env_group_slice(group))
+
+    def step_group_wait(self, group):
+        """
+        Wait for one half of the workers and return its observations.
+
+        Rewards, dones and infos are kept until step_wait assembles the full step.
+
+        :param group: Half of the workers, 0 or 1.
+        :return: Observations for the environments in env_group_slice(group).
+        """
+        for worker in self.worker_groups[group]:
+            start = worker * self.n_envs_per_process
+            for row, info in enumerate(self.remotes[worker].recv(), start):
+                self._group_infos[row] = info
+            self._in_flight.discard(worker)
+        # Copied now, since the half may be sent its next step before the other half finishes
+        rows = self.env_group_slice(group)
+        self._group_obs[group] = {key: buf[rows].copy() for key, buf in self._buf_obs.items()}
+        self._group_rewards[rows] = self._buf_rewards[rows]
+        self._group_dones[rows] = self._buf_dones[rows]
+        # A fresh dict, so transforms that replace entries cannot reach the assembled step
+        return dict_to_obs(self.observation_space, dict(self._group_obs[group]))
+
+    def seed(self, seed=None):
+        for worker, remote in enumerate(self.remotes):
+            start = worker * self.n_envs_per_process
+            seeds = [
+                seed + start + offset if seed is not None else None
+                for offset in range(self.n_envs_per_process)
+            ]
+            remote.send(("seed", seeds))
+        return [result for remote in self.remotes for result in remote.recv()]
+
+    def reset(self):
+        for remote in self.remotes:
+            remote.send(("reset", None))
+        for remote in self.remotes:
+            remote.recv()
+        return self._obs_from_buf()
+
+    def close(self):
+        if self.closed:
+            return
+        for worker in self._in_flight:
+            self.remotes[worker].recv()
+        for remote in self.remotes:
+            remote.send(("close", None))
+        for process in self.processes:
+            process.join()
+        # Views must be released before their segments can be closed
+        self._buf_obs = {}
+        self._buf_actions = self._buf_rewards = self._buf_dones = None
+        for shm in self._shms:
+            shm.close()
+            shm.unlink()
+        self.closed = True
+
+    def get_images(self):
+        for pipe in self.remotes:
+            pipe.send(("render", "rgb_array"))
+        return [image for pipe in self.remotes for image in pipe.recv()]
+
+    def get_attr(self, attr_name, indices=None):
+        return self._dispatch("get_attr", attr_name, indices)
+
+    def set_attr(self, attr_name, value, indices=None):
+        self._dispatch("set_attr", (attr_name, value), indices)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        return self._dispatch("env_method", (method_name, method_args, method_kwargs), indices)
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return self._dispatch("is_wrapped", wrapper_class, indices)
@@ -0,0 +1,74 @@
+# path: ./tests/test_overlap_ppo.py
+
+import pytest
+
+gym = pytest.importorskip("gym")
+np = pytest.importorskip("numpy")
+pytest.importorskip("stable_baselines3")
+
+from stable_baselines3.common.vec_env import VecMonitor  # noqa: E402
+
+from overlap_ppo import OverlappedPPO  # noqa: E402
+from vec_env import ShmemVecEnv  # noqa: E402
+
+
+class DummyMarioEnv(gym.Env):
+    """Short episodes with the training env's observation layout: a channel-last frame plus stats."""
+
+    def __init__(self, episode_length=5):
+        self.observation_space = gym.spaces.Dict({
+            "frame": gym.spaces.Box(low=0, high=255, shape=(84, 84, 1), dtype=np.uint8),
+            "stats": gym.spaces.Box(low=-np.inf, high=np.inf, shape=(4,), dtype=np.float32),
+        })
+        self.action_space = gym.spaces.Discrete(3)
+        self.episode_length = episode_length
+        self._t = 0
+
+    def _obs(self):
+        return {
+            "frame": np.full((84, 84, 1), self._t, dtype=np.uint8),
+            "stats": np.full(4, self._t, dtype=np.float32),
+        }
+
+    def reset(self):
+        self._t = 0
+        return self._obs()
+
+    def step(self, action):
+        self._t += 1
+        return self._obs(), float(action), self._t >= self.episode_length, {}
+
+
+def _make_env():
+    return DummyMarioEnv()
+
+
+def test_overlapped_ppo_learns_on_two_worker_shmem_env():
+    venv = ShmemVecEnv([_make_env] * 4, start_method="spawn", n_envs_per_process=2)
+    try:
+        assert [len(group) for group in venv.worker_groups] == [1, 1]
+        env = VecMonitor(venv)
+        model = OverlappedPPO("MultiInputPolicy", env, n_steps=4, batch_size=8, n_epochs=1, device="cpu")
+        # Two rollouts of several steps each, covering episode ends and the prefetch across rollouts
+        model.learn(total_timesteps=32)
+        assert model.num_timesteps >= 32
+        assert model._last_obs["frame"].shape == (4, 1, 84, 84)
+    finally:
+        venv.close()
+
+
+def test_step_group_wait_returns_a_fresh_dict():
+    venv = ShmemVecEnv([_make_env] * 4, start_method="spawn", n_envs_per_process=2)
+    try:
+        venv.reset()
+        venv.step_group_async(0, np.zeros(2, dtype=np.int64))
+        obs = venv.step_group_wait(0)
+        # Replacing an entry, as an observation transform might, must not touch the pending step
+        obs["frame"] = obs["frame"].transpose(0, 3, 1, 2)
+        assert venv._group_obs[0]["frame"].shape == (2, 84, 84, 1)
+        venv.step_group_async(1, np.zeros(2, dtype=np.int64))
+        venv.step_group_wait(1)
+        assembled, _, _, _ = venv.step_wait()
+        assert assembled["frame"].shape == (4, 84, 84, 1)
+    finally:
+        venv.close()
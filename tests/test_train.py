@@ -0,0 +1,35 @@
+# path: ./tests/test_train.py
+
+import sys
+import types
+
+import pytest
+
+train = pytest.importorskip("train")
+app_wrappers = pytest.importorskip("app_wrappers")
+
+
+def test_wrapper_blueprints_load_in_application_order():
+    blueprints = train.TrainingManager.load_blueprints("app_wrappers")
+    # Stats logging must wrap the env before reward shaping, so it records the raw reward
+    assert list(blueprints) == [
+        "EnhancedStatsWrapperBlueprint",
+        "LoggingStatsWrapperBlueprint",
+        "RewardManagerBlueprint",
+    ]
+    assert [blueprint.component_class.__name__ for blueprint in blueprints.values()] == [
+        "EnhancedStatsWrapper",
+        "LoggingStatsWrapper",
+        "DynamicRewardManager",
+    ]
+
+
+def test_failed_blueprint_load_is_retried(monkeypatch):
+    module_name = "late_blueprints"
+    assert dict(train.TrainingManager.load_blueprints(module_name)) == {}
+
+    module = types.ModuleType(module_name)
+    module.LateBlueprint = app_wrappers.EnhancedStatsWrapperBlueprint
+    monkeypatch.setitem(sys.modules, module_name, module)
+
+    assert list(train.TrainingManager.load_blueprints(module_name)) == ["LateBlueprint"]